@@ -0,0 +1,63 @@
+"""Compares the time and peak memory of projecting with Engine(dtype=np.float32) and float64.
+
+Run as python benchmarks/bench_dtype.py [grid size]. The mesh is an indexed
+grid of quads with float32 vertices, as loaders produce them; the default
+700 x 700 vertices make 488,601 quads.
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pyrr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import svg  # noqa: E402
+
+
+def grid_view(size):
+    x, y = np.meshgrid(np.linspace(-1, 1, size), np.linspace(-1, 1, size))
+    z = 0.1 * np.sin(4 * x) * np.cos(4 * y)
+    vertices = np.stack([x, y, z], axis=-1).reshape(-1, 3).astype(np.float32)
+    corners = np.arange(size * size).reshape(size, size)[:-1, :-1].reshape(-1)
+    quads = np.stack([corners, corners + 1, corners + size + 1, corners + size], axis=-1)
+    mesh = svg.Mesh.from_indexed(vertices, quads)
+    view = pyrr.matrix44.create_look_at(eye=[0, -2, -2], target=[0, 0, 0], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=45, aspect=1, near=0.5, far=10)
+    return svg.View(svg.Camera(view, projection), svg.Scene([mesh]))
+
+
+def measure(function):
+    """Returns the seconds and peak traced bytes of one call of function."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main(size=700):
+    view = grid_view(size)
+    mesh = view.scene.meshes[0]
+    projection = np.dot(view.camera.view, view.camera.projection)
+    print("%d quads" % mesh.num_faces)
+    print("%-14s %22s %22s" % ("", "float64", "float32"))
+    cases = [
+        ("_project", {}, lambda engine: engine._project(projection, mesh)),
+        ("_project+clip", {"frustum_clip": True}, lambda engine: engine._project(projection, mesh)),
+        ("_prepare", {}, lambda engine: engine._prepare(view, mesh)),
+    ]
+    for name, options, function in cases:
+        results = []
+        for dtype in (np.float64, np.float32):
+            engine = svg.Engine([view], dtype=dtype, **options)
+            function(engine)  # warm up
+            results.append(measure(lambda: function(engine)))
+        print("%-14s" % name + "".join("%12.3f s %6.0f MB" % (seconds, peak / 2 ** 20) for seconds, peak in results))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
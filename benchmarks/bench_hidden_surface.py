@@ -0,0 +1,84 @@
+"""Measures Engine(hidden_surface_removal=True) against plain painting on 10k to 100k face scenes.
+
+Run as python benchmarks/bench_hidden_surface.py [occlusion resolution]. For
+each scene it prints the polygons written, the size of the SVG and the
+render time, with the option off and on. With a resolution, a z-buffer pass
+of that size runs before hidden-surface removal.
+"""
+import io
+import os
+import sys
+import time
+
+import numpy as np
+import pyrr
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import svg  # noqa: E402
+
+
+def grid(size, height):
+    """Returns the vertices and triangles of a size x size grid over [-1, 1]^2, with z = height(x, y)."""
+    x, y = np.meshgrid(np.linspace(-1, 1, size), np.linspace(-1, 1, size))
+    vertices = np.stack([x, y, height(x, y)], axis=-1).reshape(-1, 3)
+    corners = np.arange(size * size).reshape(size, size)[:-1, :-1].reshape(-1)
+    triangles = np.concatenate([np.stack([corners, corners + 1, corners + size + 1], axis=-1),
+                                np.stack([corners, corners + size + 1, corners + size], axis=-1)])
+    return vertices, triangles
+
+
+def terrain(faces):
+    size = int(np.sqrt(faces / 2)) + 1
+    vertices, triangles = grid(size, lambda x, y: 0.15 * np.sin(5 * x) * np.cos(3 * y) + 0.05 * np.sin(17 * x * y))
+    return [svg.Mesh.from_indexed(vertices, triangles)]
+
+
+def layers(faces, count=4):
+    size = int(np.sqrt(faces / count / 2)) + 1
+    meshes = []
+    for layer in range(count):
+        vertices, triangles = grid(size, lambda x, y: 0.3 * layer - 0.45 + 0.1 * np.sin(3 * x + layer))
+        meshes.append(svg.Mesh.from_indexed(vertices, triangles))
+    return meshes
+
+
+def spheres(faces, count=9):
+    size = int(np.sqrt(faces / count / 2)) + 1
+    theta, phi = np.meshgrid(np.linspace(0, np.pi, size), np.linspace(0, 2 * np.pi, size))
+    unit = np.stack([np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)], axis=-1)
+    _, triangles = grid(size, lambda x, y: 0 * x)
+    meshes = []
+    for i in range(count):
+        center = np.array([(i % 3 - 1) * 0.5, (i // 3 - 1) * 0.5, (i % 2) * 0.3])
+        meshes.append(svg.Mesh.from_indexed(0.35 * unit.reshape(-1, 3) + center, triangles))
+    return meshes
+
+
+def render(meshes, **options):
+    """Returns the polygons, bytes and seconds of streaming meshes to an SVG."""
+    view = pyrr.matrix44.create_look_at(eye=[0.5, -2.5, -2.5], target=[0, 0, 0], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=45, aspect=1, near=0.5, far=10)
+    style = dict(fill="white", stroke="black", stroke_width="0.001")
+    scene = svg.Scene([mesh._replace(style=style) for mesh in meshes])
+    output = io.StringIO()
+    start = time.perf_counter()
+    svg.Engine([svg.View(svg.Camera(view, projection), scene)], **options).render_stream(output)
+    seconds = time.perf_counter() - start
+    text = output.getvalue()
+    return text.count("<polygon"), len(text), seconds
+
+
+def main(occlusion_resolution=None):
+    print("%-16s %17s %21s %17s" % ("scene", "polygons off -> on", "bytes off -> on", "seconds off -> on"))
+    for faces in (10000, 20000, 100000):
+        for name, scene in (("terrain", terrain), ("4 layers", layers), ("9 spheres", spheres)):
+            meshes = scene(faces)
+            off = render(meshes)
+            on = render(meshes, hidden_surface_removal=True, occlusion_resolution=occlusion_resolution)
+            label = "%s %dk" % (name, round(sum(mesh.num_faces for mesh in meshes) / 1000))
+            print("%-16s %8d -> %6d %10d -> %8d %7.2f -> %7.2f" % (label, off[0], on[0], off[1], on[1],
+                                                                 off[2], on[2]))
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -1,31 +1,11 @@
+import os
 import numpy, pyrr, math
 import svg3d
 import numpy as np
 
-data = [[{'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.14000000059604645}, {'x': -0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}], [{'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}], [{'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.10000000149011612}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.13999998569488525}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.09999999403953552}], [{'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.10000000149011612}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}], [{'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.05999999865889549}], [{'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}], [{'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}], [{'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}], [{'x': -0.0770379975438118, 'y': 0.0, 'z': -0.055434003472328186}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.09999999403953552, 'y': 0.0, 'z': -0.05999999865889549}], [{'x': -0.05757399648427963, 'y': 0.0, 'z': -0.04242599755525589}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': -0.0770379975438118, 'y': 0.0, 'z': -0.055434003472328186}], [{'x': -0.044565990567207336, 'y': 0.0, 'z': -0.022961998358368874}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': -0.05757399648427963, 'y': 0.0, 'z': -0.04242599755525589}], [{'x': -0.03999999538064003, 'y': 0.0, 'z': 0.0}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': -0.044565990567207336, 'y': 0.0, 'z': -0.022961998358368874}], [{'x': -0.044565990567207336, 'y': 0.0, 'z': 0.022961998358368874}, {'x': -0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.03999999538064003, 'y': 0.0, 'z': 0.0}], [{'x': -0.05757399648427963, 'y': 0.0, 'z': 0.04242599755525589}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': -0.044565990567207336, 'y': 0.0, 'z': 0.022961998358368874}], [{'x': -0.0770379975438118, 'y': 0.0, 'z': 0.055434003472328186}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': -0.05757399648427963, 'y': 0.0, 'z': 0.04242599755525589}], [{'x': -0.09999999403953552, 'y': 0.0, 'z': 0.05999999865889549}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': -0.0770379975438118, 'y': 0.0, 'z': 0.055434003472328186}], [{'x': -0.12296199053525925, 'y': 0.0, 'z': 0.055434003472328186}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}, {'x': -0.09999999403953552, 'y': 0.0, 'z': 0.05999999865889549}], [{'x': -0.14242598414421082, 'y': 0.0, 'z': 0.04242599755525589}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': -0.12296199053525925, 'y': 0.0, 'z': 0.055434003472328186}], [{'x': -0.1554339975118637, 'y': 0.0, 'z': 0.022961998358368874}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': -0.14242598414421082, 'y': 0.0, 'z': 0.04242599755525589}], [{'x': -0.1599999964237213, 'y': 0.0, 'z': 0.0}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': -0.1554339975118637, 'y': 0.0, 'z': 0.022961998358368874}], [{'x': -0.1554339975118637, 'y': 0.0, 'z': -0.022961998358368874}, {'x': -0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.1599999964237213, 'y': 0.0, 'z': 0.0}], [{'x': -0.14242598414421082, 'y': 0.0, 'z': -0.04242599755525589}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': -0.1554339975118637, 'y': 0.0, 'z': -0.022961998358368874}], [{'x': -0.12296199053525925, 'y': 0.0, 'z': -0.055434003472328186}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': -0.14242598414421082, 'y': 0.0, 'z': -0.04242599755525589}], [{'x': -0.09999999403953552, 'y': 0.0, 'z': -0.05999999865889549}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': -0.12296199053525925, 'y': 0.0, 'z': -0.055434003472328186}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': -0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': -0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}], [{'x': 0.12296199053525925, 'y': 0.0, 'z': -0.055434003472328186}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.09999999403953552, 'y': 0.0, 'z': -0.05999999865889549}], [{'x': 0.14242598414421082, 'y': 0.0, 'z': -0.04242599755525589}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': 0.12296199053525925, 'y': 0.0, 'z': -0.055434003472328186}], [{'x': 0.1554339975118637, 'y': 0.0, 'z': -0.022961998358368874}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': 0.14242598414421082, 'y': 0.0, 'z': -0.04242599755525589}], [{'x': 0.1599999964237213, 'y': 0.0, 'z': 0.0}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': 0.1554339975118637, 'y': 0.0, 'z': -0.022961998358368874}], [{'x': 0.1554339975118637, 'y': 0.0, 'z': 0.022961998358368874}, {'x': 0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.1599999964237213, 'y': 0.0, 'z': 0.0}], [{'x': 0.14242598414421082, 'y': 0.0, 'z': 0.04242599755525589}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': 0.1554339975118637, 'y': 0.0, 'z': 0.022961998358368874}], [{'x': 0.12296199053525925, 'y': 0.0, 'z': 0.055434003472328186}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': 0.14242598414421082, 'y': 0.0, 'z': 0.04242599755525589}], [{'x': 0.09999999403953552, 'y': 0.0, 'z': 0.05999999865889549}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': 0.12296199053525925, 'y': 0.0, 'z': 0.055434003472328186}], [{'x': 0.0770379975438118, 'y': 0.0, 'z': 0.055434003472328186}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}, {'x': 0.09999999403953552, 'y': 0.0, 'z': 0.05999999865889549}], [{'x': 0.05757399648427963, 'y': 0.0, 'z': 0.04242599755525589}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': 0.0770379975438118, 'y': 0.0, 'z': 0.055434003472328186}], [{'x': 0.044565990567207336, 'y': 0.0, 'z': 0.022961998358368874}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': 0.05757399648427963, 'y': 0.0, 'z': 0.04242599755525589}], [{'x': 0.03999999538064003, 'y': 0.0, 'z': 0.0}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': 0.044565990567207336, 'y': 0.0, 'z': 0.022961998358368874}], [{'x': 0.044565990567207336, 'y': 0.0, 'z': -0.022961998358368874}, {'x': 0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.03999999538064003, 'y': 0.0, 'z': 0.0}], [{'x': 0.05757399648427963, 'y': 0.0, 'z': -0.04242599755525589}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': 0.044565990567207336, 'y': 0.0, 'z': -0.022961998358368874}], [{'x': 0.0770379975438118, 'y': 0.0, 'z': -0.055434003472328186}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': 0.05757399648427963, 'y': 0.0, 'z': -0.04242599755525589}], [{'x': 0.09999999403953552, 'y': 0.0, 'z': -0.05999999865889549}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': 0.0770379975438118, 'y': 0.0, 'z': -0.055434003472328186}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': 0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': 0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}], [{'x': -0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.13999998569488525}, {'x': 0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}, {'x': -0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}], [{'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}], [{'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.09999999403953552}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}], [{'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.13999998569488525}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.09999999403953552}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.13999998569488525}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.09999999403953552}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.09999999403953552}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.09999999403953552}], [{'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.09999999403953552}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.10000000149011612}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.10000000149011612}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.10000000149011612}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.10000000149011612}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.10000000149011612}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}], [{'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}], [{'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}], [{'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.10000000149011612}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}], [{'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.10000000149011612}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.10000000149011612}], [{'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.10000000149011612}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.10000000149011612}], [{'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}], [{'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}], [{'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}], [{'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}], [{'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}], [{'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}], [{'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}], [{'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}], [{'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}], [{'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}], [{'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.14000000059604645}], [{'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.14000000059604645}], [{'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.14000000059604645}], [{'x': 0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': 0.15543398261070251, 'y': 0.0770379900932312, 'z': -0.18000000715255737}, {'x': 0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.14000000059604645}], [{'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.14000000059604645}], [{'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.14000000059604645}], [{'x': 0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.14000000059604645}], [{'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': 0.0770379900932312, 'y': 0.04456599801778793, 'z': -0.18000000715255737}, {'x': 0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.14000000059604645}], [{'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': 0.04456599801778793, 'y': 0.0770379900932312, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.04456599801778793, 'y': 0.0770379900932312, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.14000000059604645}], [{'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.14000000059604645}], [{'x': 0.0770379975438118, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.14000000059604645}], [{'x': 0.0770379975438118, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.0770379900932312, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.0770379900932312, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.04456599801778793, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.04456599801778793, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.04456599801778793, 'y': 0.0770379900932312, 'z': -0.18000000715255737}], [{'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.04456599801778793, 'y': 0.0770379900932312, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}], [{'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}], [{'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}], [{'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}], [{'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': -0.0770379975438118, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.14000000059604645}], [{'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': -0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.1554339975118637, 'z': -0.14000000059604645}], [{'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.14000000059604645}], [{'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.14000000059604645}], [{'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.14000000059604645}, {'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.14000000059604645}], [{'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.14000000059604645}], [{'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.14000000059604645}, {'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.14000000059604645}], [{'x': -0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.14000000059604645}], [{'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.04456599801778793, 'z': -0.18000000715255737}, {'x': -0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.14000000059604645}], [{'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.14000000059604645}, {'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.14000000059604645}], [{'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.14000000059604645}], [{'x': -0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.14000000059604645}], [{'x': -0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.04456599801778793, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.04456599801778793, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.18000000715255737}], [{'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': -0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}], [{'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}], [{'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}], [{'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}], [{'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': -0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.14000000059604645}], [{'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': -0.0770379900932312, 'y': 0.35543397068977356, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.14000000059604645}], [{'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.14000000059604645}], [{'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.14000000059604645}], [{'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.14000000059604645}], [{'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.14000000059604645}], [{'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.14000000059604645}, {'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.14000000059604645}], [{'x': -0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.14000000059604645}], [{'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.24456599354743958, 'z': -0.18000000715255737}, {'x': -0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.14000000059604645}], [{'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.14000000059604645}], [{'x': -0.1554339975118637, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': -0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.3229619860649109, 'z': -0.14000000059604645}], [{'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.35543397068977356, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.35543397068977356, 'z': -0.18000000715255737}, {'x': -0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.14000000059604645}], [{'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.24456599354743958, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.24456599354743958, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.35543397068977356, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.35543397068977356, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': -0.0770379900932312, 'y': 0.35543397068977356, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.0770379900932312, 'y': 0.35543397068977356, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}], [{'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}], [{'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}], [{'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}], [{'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.14000000059604645}], [{'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.14000000059604645}], [{'x': 0.1554339975118637, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': 0.1554339975118637, 'y': 0.3229619860649109, 'z': -0.14000000059604645}], [{'x': 0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': 0.15543398261070251, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': 0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.14000000059604645}], [{'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.14000000059604645}], [{'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.14000000059604645}], [{'x': 0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.14000000059604645}], [{'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': 0.0770379900932312, 'y': 0.24456599354743958, 'z': -0.18000000715255737}, {'x': 0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.14000000059604645}], [{'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.14000000059604645}], [{'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.14000000059604645}], [{'x': 0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': 0.04456599801778793, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.14000000059604645}], [{'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.14000000059604645}, {'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.14000000059604645}], [{'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.18000000715255737}, {'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.14000000059604645}], [{'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.24456599354743958, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.24456599354743958, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.04456599801778793, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.04456599801778793, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}, {'x': 0.0, 'y': 0.07999999821186066, 'z': 0.03999999910593033}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.0, 'y': 0.07999999821186066, 'z': 0.03999999910593033}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}, {'x': 0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}, {'x': 0.0, 'y': 0.07999999821186066, 'z': -0.03999999910593033}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.0, 'y': 0.07999999821186066, 'z': -0.03999999910593033}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}], [{'x': 0.0, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}, {'x': -0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}], [{'x': -0.036956001073122025, 'y': 0.03999999910593033, 'z': 0.015307999216020107}, {'x': -0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.03999999910593033, 'y': 0.03999999910593033, 'z': 0.0}], [{'x': -0.028283998370170593, 'y': 0.03999999910593033, 'z': 0.028283998370170593}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}, {'x': -0.036956001073122025, 'y': 0.03999999910593033, 'z': 0.015307999216020107}], [{'x': -0.015307999216020107, 'y': 0.03999999910593033, 'z': 0.036956001073122025}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}, {'x': -0.028283998370170593, 'y': 0.03999999910593033, 'z': 0.028283998370170593}], [{'x': 0.0, 'y': 0.03999999910593033, 'z': 0.03999999910593033}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}, {'x': -0.015307999216020107, 'y': 0.03999999910593033, 'z': 0.036956001073122025}], [{'x': 0.015307999216020107, 'y': 0.03999999910593033, 'z': 0.036956001073122025}, {'x': 0.0, 'y': 0.07999999821186066, 'z': 0.03999999910593033}, {'x': 0.0, 'y': 0.03999999910593033, 'z': 0.03999999910593033}], [{'x': 0.028283998370170593, 'y': 0.03999999910593033, 'z': 0.028283998370170593}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}, {'x': 0.015307999216020107, 'y': 0.03999999910593033, 'z': 0.036956001073122025}], [{'x': 0.036956001073122025, 'y': 0.03999999910593033, 'z': 0.015307999216020107}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}, {'x': 0.028283998370170593, 'y': 0.03999999910593033, 'z': 0.028283998370170593}], [{'x': 0.03999999910593033, 'y': 0.03999999910593033, 'z': 0.0}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}, {'x': 0.036956001073122025, 'y': 0.03999999910593033, 'z': 0.015307999216020107}], [{'x': 0.036956001073122025, 'y': 0.03999999910593033, 'z': -0.015307999216020107}, {'x': 0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.03999999910593033, 'y': 0.03999999910593033, 'z': 0.0}], [{'x': 0.028283998370170593, 'y': 0.03999999910593033, 'z': -0.028283998370170593}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}, {'x': 0.036956001073122025, 'y': 0.03999999910593033, 'z': -0.015307999216020107}], [{'x': 0.015307999216020107, 'y': 0.03999999910593033, 'z': -0.036956001073122025}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}, {'x': 0.028283998370170593, 'y': 0.03999999910593033, 'z': -0.028283998370170593}], [{'x': 0.0, 'y': 0.03999999910593033, 'z': -0.03999999910593033}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}, {'x': 0.015307999216020107, 'y': 0.03999999910593033, 'z': -0.036956001073122025}], [{'x': -0.015307999216020107, 'y': 0.03999999910593033, 'z': -0.036956001073122025}, {'x': 0.0, 'y': 0.07999999821186066, 'z': -0.03999999910593033}, {'x': 0.0, 'y': 0.03999999910593033, 'z': -0.03999999910593033}], [{'x': -0.028283998370170593, 'y': 0.03999999910593033, 'z': -0.028283998370170593}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}, {'x': -0.015307999216020107, 'y': 0.03999999910593033, 'z': -0.036956001073122025}], [{'x': -0.036956001073122025, 'y': 0.03999999910593033, 'z': -0.015307999216020107}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}, {'x': -0.028283998370170593, 'y': 0.03999999910593033, 'z': -0.028283998370170593}], [{'x': -0.03999999910593033, 'y': 0.03999999910593033, 'z': 0.0}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}, {'x': -0.036956001073122025, 'y': 0.03999999910593033, 'z': -0.015307999216020107}], [{'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}, {'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}], [{'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}], [{'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}, {'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.14000000059604645}, {'x': -0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}, {'x': -0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}], [{'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}], [{'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.10000000149011612}, {'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.13999998569488525}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.14000000059604645}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}], [{'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.10000000149011612}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.05999999865889549}], [{'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}], [{'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': -0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}], [{'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.14000000059604645}], [{'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.35999998450279236, 'z': -0.09999999403953552}], [{'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}], [{'x': -0.0770379975438118, 'y': 0.0, 'z': -0.055434003472328186}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}], [{'x': -0.05757399648427963, 'y': 0.0, 'z': -0.04242599755525589}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': -0.044565990567207336, 'y': 0.0, 'z': -0.022961998358368874}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': -0.03999999538064003, 'y': 0.0, 'z': 0.0}, {'x': -0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': -0.044565990567207336, 'y': 0.0, 'z': 0.022961998358368874}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': -0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': -0.05757399648427963, 'y': 0.0, 'z': 0.04242599755525589}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': -0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': -0.0770379975438118, 'y': 0.0, 'z': 0.055434003472328186}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': -0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': -0.09999999403953552, 'y': 0.0, 'z': 0.05999999865889549}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}, {'x': -0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': -0.12296199053525925, 'y': 0.0, 'z': 0.055434003472328186}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}], [{'x': -0.14242598414421082, 'y': 0.0, 'z': 0.04242599755525589}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': -0.1554339975118637, 'y': 0.0, 'z': 0.022961998358368874}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': -0.1599999964237213, 'y': 0.0, 'z': 0.0}, {'x': -0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': -0.1554339975118637, 'y': 0.0, 'z': -0.022961998358368874}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': -0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': -0.14242598414421082, 'y': 0.0, 'z': -0.04242599755525589}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': -0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': -0.12296199053525925, 'y': 0.0, 'z': -0.055434003472328186}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': -0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': -0.09999999403953552, 'y': 0.0, 'z': -0.05999999865889549}, {'x': -0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': 0.12296199053525925, 'y': 0.0, 'z': -0.055434003472328186}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}], [{'x': 0.14242598414421082, 'y': 0.0, 'z': -0.04242599755525589}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': 0.1554339975118637, 'y': 0.0, 'z': -0.022961998358368874}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': 0.1599999964237213, 'y': 0.0, 'z': 0.0}, {'x': 0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': 0.1554339975118637, 'y': 0.0, 'z': 0.022961998358368874}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': 0.1599999964237213, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': 0.14242598414421082, 'y': 0.0, 'z': 0.04242599755525589}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': 0.1554339975118637, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': 0.12296199053525925, 'y': 0.0, 'z': 0.055434003472328186}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': 0.14242598414421082, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': 0.09999999403953552, 'y': 0.0, 'z': 0.05999999865889549}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}, {'x': 0.12296199053525925, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': 0.0770379975438118, 'y': 0.0, 'z': 0.055434003472328186}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': 0.05999999865889549}], [{'x': 0.05757399648427963, 'y': 0.0, 'z': 0.04242599755525589}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': 0.055434003472328186}], [{'x': 0.044565990567207336, 'y': 0.0, 'z': 0.022961998358368874}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': 0.04242599755525589}], [{'x': 0.03999999538064003, 'y': 0.0, 'z': 0.0}, {'x': 0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': 0.022961998358368874}], [{'x': 0.044565990567207336, 'y': 0.0, 'z': -0.022961998358368874}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}, {'x': 0.03999999538064003, 'y': -0.03999999910593033, 'z': 0.0}], [{'x': 0.05757399648427963, 'y': 0.0, 'z': -0.04242599755525589}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}, {'x': 0.044565990567207336, 'y': -0.03999999910593033, 'z': -0.022961998358368874}], [{'x': 0.0770379975438118, 'y': 0.0, 'z': -0.055434003472328186}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}, {'x': 0.05757399648427963, 'y': -0.03999999910593033, 'z': -0.04242599755525589}], [{'x': 0.09999999403953552, 'y': 0.0, 'z': -0.05999999865889549}, {'x': 0.09999999403953552, 'y': -0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.0770379975438118, 'y': -0.03999999910593033, 'z': -0.055434003472328186}], [{'x': -0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.0, 'z': 0.09999999403953552}, {'x': 0.19999998807907104, 'y': 0.07999999821186066, 'z': 0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.13999998569488525}, {'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.19999998807907104, 'y': 0.0, 'z': -0.14000000059604645}], [{'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.09999999403953552}], [{'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.09999999403953552}, {'x': -0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}], [{'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.09999999403953552}, {'x': -0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.09999999403953552}], [{'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.13999998569488525}, {'x': -0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.09999999403953552}, {'x': -0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.09999999403953552}], [{'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.09999999403953552}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.3999999761581421, 'z': -0.14000000059604645}], [{'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.10000000149011612}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}, {'x': 0.1753079891204834, 'y': 0.3969559967517853, 'z': -0.14000000059604645}], [{'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.10000000149011612}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}, {'x': 0.1882839947938919, 'y': 0.38828396797180176, 'z': -0.14000000059604645}], [{'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.10000000149011612}, {'x': 0.19999998807907104, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.19695599377155304, 'y': 0.37530797719955444, 'z': -0.14000000059604645}], [{'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}], [{'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}], [{'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': -0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}], [{'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': -0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}], [{'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': -0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}], [{'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}], [{'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}], [{'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.11999998986721039, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}], [{'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': 0.07999999821186066, 'y': 0.03999999910593033, 'z': -0.05999999865889549}, {'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}], [{'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.07999999821186066, 'y': 0.07999999821186066, 'z': -0.05999999865889549}, {'x': 0.11999998986721039, 'y': 0.07999999821186066, 'z': -0.05999999865889549}], [{'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.14000000059604645}], [{'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.14000000059604645}], [{'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.14000000059604645}], [{'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.14000000059604645}], [{'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.14000000059604645}], [{'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.14000000059604645}], [{'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.14000000059604645}], [{'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.14000000059604645}], [{'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.14000000059604645}], [{'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.14000000059604645}], [{'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.14000000059604645}], [{'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.14000000059604645}], [{'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.14000000059604645}], [{'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.14000000059604645}], [{'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.18000000715255737}], [{'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': 0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.14000000059604645}, {'x': 0.15543398261070251, 'y': 0.0770379900932312, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.0770379900932312, 'z': -0.18000000715255737}], [{'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.18000000715255737}], [{'x': 0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': 0.0770379900932312, 'y': 0.04456599801778793, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.04456599801778793, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': 0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.14000000059604645}, {'x': 0.04456599801778793, 'y': 0.0770379900932312, 'z': -0.18000000715255737}], [{'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.04456599801778793, 'y': 0.0770379900932312, 'z': -0.18000000715255737}], [{'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': 0.0770379975438118, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': 0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': 0.0770379975438118, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': 0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.14000000059604645}], [{'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.14000000059604645}], [{'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.14000000059604645}], [{'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.14000000059604645}], [{'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.14000000059604645}], [{'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.14000000059604645}], [{'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.14000000059604645}], [{'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.14000000059604645}], [{'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.14000000059604645}], [{'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.14000000059604645}], [{'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.14000000059604645}], [{'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.14000000059604645}, {'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.14000000059604645}], [{'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.14000000059604645}], [{'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.14000000059604645}], [{'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.14000000059604645}], [{'x': -0.0770379975438118, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': -0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.0770379900932312, 'y': 0.15543398261070251, 'z': -0.18000000715255737}], [{'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.0770379975438118, 'z': -0.18000000715255737}], [{'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.044565990567207336, 'z': -0.18000000715255737}], [{'x': -0.12296199053525925, 'y': 0.044565990567207336, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.04456599801778793, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.14000000059604645}, {'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.04456599801778793, 'z': -0.18000000715255737}], [{'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.14000000059604645}, {'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.0770379975438118, 'z': -0.18000000715255737}], [{'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.14000000059604645}, {'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.14000000059604645}, {'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.12296199053525925, 'z': -0.18000000715255737}], [{'x': -0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.15543398261070251, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': -0.12296199053525925, 'y': 0.1554339975118637, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.059999994933605194, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.03999999538064003, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.0630439966917038, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.07171599566936493, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.05757399648427963, 'z': -0.18000000715255737}], [{'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.08469199389219284, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.09999999403953552, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.13999998569488525, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.1599999964237213, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.13695599138736725, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.12828399240970612, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.14242598414421082, 'z': -0.18000000715255737}], [{'x': -0.03999999538064003, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.09999999403953552, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.1153079941868782, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.14000000059604645}], [{'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.14000000059604645}], [{'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.14000000059604645}], [{'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.14000000059604645}], [{'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.14000000059604645}], [{'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.14000000059604645}], [{'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.14000000059604645}, {'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.14000000059604645}], [{'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.14000000059604645}], [{'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.14000000059604645}], [{'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.14000000059604645}], [{'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.14000000059604645}], [{'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.14000000059604645}], [{'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.14000000059604645}], [{'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.14000000059604645}, {'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.14000000059604645}], [{'x': -0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.14000000059604645}, {'x': -0.0770379900932312, 'y': 0.35543397068977356, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.0770379900932312, 'y': 0.35543397068977356, 'z': -0.18000000715255737}], [{'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': -0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.18000000715255737}], [{'x': -0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.24456599354743958, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.24456599354743958, 'z': -0.18000000715255737}], [{'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': -0.1554339975118637, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': -0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': -0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.14000000059604645}, {'x': -0.12296199798583984, 'y': 0.35543397068977356, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': -0.12296199798583984, 'y': 0.35543397068977356, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': -0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': -0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}], [{'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': -0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': -0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': -0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': -0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.14000000059604645}], [{'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.14000000059604645}], [{'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.14000000059604645}], [{'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.14000000059604645}], [{'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.14000000059604645}], [{'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.14000000059604645}], [{'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.14000000059604645}, {'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.14000000059604645}], [{'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.14000000059604645}], [{'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.14000000059604645}], [{'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.14000000059604645}], [{'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.14000000059604645}], [{'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.14000000059604645}, {'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.14000000059604645}], [{'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.14000000059604645}, {'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.14000000059604645}], [{'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.14000000059604645}, {'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.14000000059604645}], [{'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.14000000059604645}, {'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.14000000059604645}], [{'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.35543400049209595, 'z': -0.18000000715255737}], [{'x': 0.1554339975118637, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': 0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': 0.1554339975118637, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': 0.15543398261070251, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.15543398261070251, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': 0.12296199053525925, 'y': 0.24456597864627838, 'z': -0.18000000715255737}], [{'x': 0.0770379975438118, 'y': 0.24456597864627838, 'z': -0.14000000059604645}, {'x': 0.0770379900932312, 'y': 0.24456599354743958, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.14000000059604645}, {'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.0770379900932312, 'y': 0.24456599354743958, 'z': -0.18000000715255737}], [{'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.14000000059604645}, {'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.14000000059604645}, {'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.044565990567207336, 'y': 0.27703797817230225, 'z': -0.18000000715255737}], [{'x': 0.044565990567207336, 'y': 0.3229619860649109, 'z': -0.14000000059604645}, {'x': 0.04456599801778793, 'y': 0.3229619860649109, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.14000000059604645}, {'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.04456599801778793, 'y': 0.3229619860649109, 'z': -0.18000000715255737}], [{'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.14000000059604645}, {'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.14000000059604645}, {'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': 0.0770379975438118, 'y': 0.35543400049209595, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.25999999046325684, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.23999997973442078, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.26304396986961365, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.27171599864959717, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.2575739920139313, 'z': -0.18000000715255737}], [{'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.2846919894218445, 'z': -0.18000000715255737}], [{'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.059999994933605194, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.03999999538064003, 'y': 0.29999998211860657, 'z': -0.18000000715255737}], [{'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.0630439966917038, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.07171599566936493, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.05757399648427963, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': 0.08469199389219284, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.3399999737739563, 'z': -0.18000000715255737}, {'x': 0.09999999403953552, 'y': 0.35999998450279236, 'z': -0.18000000715255737}], [{'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.1153079941868782, 'y': 0.3369559943675995, 'z': -0.18000000715255737}], [{'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}, {'x': 0.12828399240970612, 'y': 0.32828396558761597, 'z': -0.18000000715255737}, {'x': 0.14242598414421082, 'y': 0.34242597222328186, 'z': -0.18000000715255737}], [{'x': 0.1599999964237213, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.13999998569488525, 'y': 0.29999998211860657, 'z': -0.18000000715255737}, {'x': 0.13695599138736725, 'y': 0.31530797481536865, 'z': -0.18000000715255737}], [{'x': -0.036956001073122025, 'y': 0.03999999910593033, 'z': 0.015307999216020107}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}, {'x': -0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}], [{'x': -0.028283998370170593, 'y': 0.03999999910593033, 'z': 0.028283998370170593}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}], [{'x': -0.015307999216020107, 'y': 0.03999999910593033, 'z': 0.036956001073122025}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}], [{'x': 0.0, 'y': 0.03999999910593033, 'z': 0.03999999910593033}, {'x': 0.0, 'y': 0.07999999821186066, 'z': 0.03999999910593033}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}], [{'x': 0.015307999216020107, 'y': 0.03999999910593033, 'z': 0.036956001073122025}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}, {'x': 0.0, 'y': 0.07999999821186066, 'z': 0.03999999910593033}], [{'x': 0.028283998370170593, 'y': 0.03999999910593033, 'z': 0.028283998370170593}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': 0.036956001073122025}], [{'x': 0.036956001073122025, 'y': 0.03999999910593033, 'z': 0.015307999216020107}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': 0.028283998370170593}], [{'x': 0.03999999910593033, 'y': 0.03999999910593033, 'z': 0.0}, {'x': 0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': 0.015307999216020107}], [{'x': 0.036956001073122025, 'y': 0.03999999910593033, 'z': -0.015307999216020107}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}, {'x': 0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}], [{'x': 0.028283998370170593, 'y': 0.03999999910593033, 'z': -0.028283998370170593}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}, {'x': 0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}], [{'x': 0.015307999216020107, 'y': 0.03999999910593033, 'z': -0.036956001073122025}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}, {'x': 0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}], [{'x': 0.0, 'y': 0.03999999910593033, 'z': -0.03999999910593033}, {'x': 0.0, 'y': 0.07999999821186066, 'z': -0.03999999910593033}, {'x': 0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}], [{'x': -0.015307999216020107, 'y': 0.03999999910593033, 'z': -0.036956001073122025}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}, {'x': 0.0, 'y': 0.07999999821186066, 'z': -0.03999999910593033}], [{'x': -0.028283998370170593, 'y': 0.03999999910593033, 'z': -0.028283998370170593}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}, {'x': -0.015307999216020107, 'y': 0.07999999821186066, 'z': -0.036956001073122025}], [{'x': -0.036956001073122025, 'y': 0.03999999910593033, 'z': -0.015307999216020107}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}, {'x': -0.028283998370170593, 'y': 0.07999999821186066, 'z': -0.028283998370170593}], [{'x': -0.03999999910593033, 'y': 0.03999999910593033, 'z': 0.0}, {'x': -0.03999999910593033, 'y': 0.07999999821186066, 'z': 0.0}, {'x': -0.036956001073122025, 'y': 0.07999999821186066, 'z': -0.015307999216020107}], [{'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}], [{'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}], [{'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': 0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': 0.1599999964237213, 'y': 0.03999999910593033, 'z': -0.09999999403953552}], [{'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': -0.09999999403953552}, {'x': -0.1599999964237213, 'y': 0.07999999821186066, 'z': 0.05999999865889549}, {'x': -0.1599999964237213, 'y': 0.03999999910593033, 'z': 0.05999999865889549}]]
-
-data = [[{'x': -6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}, {'x': -6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}, {'x': -6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}, {'x': -6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}], [{'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}], [{'x': 6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}, {'x': 6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}, {'x': 6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}, {'x': 6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}], [{'x': 6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}, {'x': 6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}], [{'x': -6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}, {'x': 6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}, {'x': 6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}, {'x': -6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}], [{'x': 6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}, {'x': -6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}, {'x': -6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}, {'x': 6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}], [{'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': -6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}, {'x': -6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}], [{'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': 6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}, {'x': -6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}], [{'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': -6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}, {'x': 6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}], [{'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': 6.632016658782959, 'y': 6.632016658782959, 'z': 6.632016658782959}, {'x': 6.632016658782959, 'y': 6.632016658782959, 'z': -6.632016658782959}], [{'x': 6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}, {'x': -6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}], [{'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}], [{'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': -3.929257392883301}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}], [{'x': -3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': 3.9292569160461426, 'y': 6.215127944946289, 'z': 3.929257392883301}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}], [{'x': -6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': 3.929257392883301}, {'x': -6.632016658782959, 'y': -6.632016658782959, 'z': 6.632016658782959}], [{'x': -6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}, {'x': 6.632016658782959, 'y': -6.632016658782959, 'z': -6.632016658782959}, {'x': 3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}, {'x': -3.9292569160461426, 'y': -6.149614334106445, 'z': -3.929257392883301}]]
-
-
-polys = []
-# Download data set from plotly repo
-for polygon in data:
-    empty = None
-    for points in polygon:
-   
-        r = list(points.values())
-        f = np.array([r])
-        if empty is None:
-            empty = f
-        else:
-            empty = np.append(empty,f, axis=0)
-   
-    arr = np.array([empty])
-    arr *= 1
-    polys.append(arr)
-
-vertices = np.concatenate(polys, axis=0)
-face_idxs = np.concatenate([np.ones(poly.shape[0]) *i for i, poly in enumerate(polys)], axis=0)
+# The mesh lives in an OBJ file next to this script; svg3d.load_mesh also
+# reads binary PLY, binary STL and NPZ files.
+MESH_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "example.obj")
 
 # def get_octahedron_faces():
 #     f = math.sqrt(2.0) / 2.0
@@ -64,7 +44,7 @@ def generate_svg(filename):
         stroke_linejoin="round",
         stroke_width="0.005",
     )
-    mesh = svg3d.Mesh(vertices=vertices, face_idxs=face_idxs, style=style)
+    mesh = svg3d.load_obj(MESH_PATH, style=style)
     view = svg3d.View(camera, svg3d.Scene([mesh]))
     svg3d.Engine([view]).render(filename)
 
@@ -1,8 +1,19 @@
+import collections
+import concurrent.futures
+import copy
+import itertools
+import os
+import re
+import struct
+import tempfile
+import time
+import warnings
+
 import numpy as np
-from numpy.core.fromnumeric import sort
 import pyrr
 import svgwrite
 
+from svgwrite.data.full11 import presentation_attributes
 from typing import NamedTuple, Callable, Sequence, List
 
 
@@ -28,12 +39,70 @@ class Camera(NamedTuple):
 
 
 class Mesh(NamedTuple):
-    num_faces: int
+    # Corners of all faces, stored face after face: face i is the contiguous
+    # slice faces[face_offsets[i]:face_offsets[i + 1]]. In indexed mode, faces
+    # holds unique vertices and indices holds the vertex index of each corner.
     faces: np.ndarray
-    face_idxs: np.ndarray
+    face_offsets: np.ndarray
     shader: Callable[[int, float], dict] = None
     style: dict = None
     circle_radius: float = 0
+    indices: np.ndarray = None
+    # Drop polygons that wind clockwise on screen, i.e. face away from the camera.
+    cull_backfaces: bool = False
+    # Replaces shader with one call per batch of faces; see Engine._batch_styles.
+    batch_shader: Callable = None
+    # Draw each unique edge once, as a line, instead of the faces. Shaders
+    # then receive edge indices; see Engine._edge_mesh.
+    wireframe: bool = False
+
+    @classmethod
+    def from_face_idxs(cls, faces, face_idxs, num_faces=None, **kwargs):
+        """Builds a mesh from a corner array labelled with a face index per corner."""
+        faces = np.asarray(faces)
+        labels = np.asarray(face_idxs).astype(int)
+        if num_faces is None:
+            num_faces = labels.max() + 1 if labels.size else 0
+        if np.any(labels[1:] < labels[:-1]):
+            order = np.argsort(labels, kind="stable")
+            faces, labels = faces[order], labels[order]
+        face_offsets = np.zeros(num_faces + 1, dtype=np.intp)
+        np.cumsum(np.bincount(labels, minlength=num_faces), out=face_offsets[1:])
+        return cls(faces, face_offsets, **kwargs)
+
+    @classmethod
+    def from_indexed(cls, vertices, polygons, **kwargs):
+        """Builds an indexed mesh from unique vertices and a vertex index list per face.
+
+        polygons is either an (num_faces, n) integer array or a sequence of
+        index sequences of any length.
+        """
+        if isinstance(polygons, np.ndarray) and polygons.ndim == 2:
+            counts = np.full(len(polygons), polygons.shape[1], dtype=np.intp)
+            indices = polygons.reshape(-1).astype(np.intp)
+        else:
+            counts = np.fromiter(map(len, polygons), dtype=np.intp, count=len(polygons))
+            indices = np.fromiter(itertools.chain.from_iterable(polygons), dtype=np.intp,
+                                  count=counts.sum())
+        face_offsets = np.zeros(len(counts) + 1, dtype=np.intp)
+        np.cumsum(counts, out=face_offsets[1:])
+        return cls(np.asarray(vertices), face_offsets, indices=indices, **kwargs)
+
+    @classmethod
+    def from_points(cls, points, circle_radius=1, **kwargs):
+        """Builds a point cloud mesh, each point being a face of its own."""
+        points = np.asarray(points)
+        return cls(points, np.arange(len(points) + 1), circle_radius=circle_radius, **kwargs)
+
+    @property
+    def num_faces(self):
+        return len(self.face_offsets) - 1
+
+    def face(self, face_index):
+        corners = slice(self.face_offsets[face_index], self.face_offsets[face_index + 1])
+        if self.indices is None:
+            return self.faces[corners]
+        return self.faces[self.indices[corners]]
 
 
 class Scene(NamedTuple):
@@ -49,35 +118,478 @@ class View(NamedTuple):
     viewport: Viewport = Viewport()
 
 
+class PulledFaces(NamedTuple):
+    # Projected corners face after face, split by face_offsets like Mesh.faces,
+    # so Mesh(pulled.vertices, pulled.face_offsets) rebuilds a mesh from them.
+    vertices: np.ndarray
+    face_offsets: np.ndarray
+    face_ids: np.ndarray
+    mesh_ids: np.ndarray
+
+    @classmethod
+    def concatenate(cls, parts):
+        """Joins per-mesh results, numbering the meshes in order."""
+        if len(parts) == 1:
+            return parts[0]
+        if not parts:
+            return cls(np.zeros((0, 3)), np.zeros(1, dtype=np.intp), np.zeros(0, dtype=np.intp),
+                       np.zeros(0, dtype=np.intp))
+        counts = [len(part.face_ids) for part in parts]
+        shifts = np.cumsum([0] + [len(part.vertices) for part in parts])
+        face_offsets = np.concatenate([[0]] + [part.face_offsets[1:] + shift
+                                               for part, shift in zip(parts, shifts)])
+        return cls(np.concatenate([part.vertices for part in parts]), face_offsets,
+                   np.concatenate([part.face_ids for part in parts]),
+                   np.repeat(np.arange(len(parts)), counts))
+
+    @property
+    def points(self):
+        """The vertices as a structured array with x, y and z fields, sharing their memory."""
+        vertices = np.ascontiguousarray(self.vertices)
+        return vertices.view([("x", vertices.dtype), ("y", vertices.dtype), ("z", vertices.dtype)])[:, 0]
+
+    def face(self, face_index):
+        return self.vertices[self.face_offsets[face_index]:self.face_offsets[face_index + 1]]
+
+
+class SequenceStats(NamedTuple):
+    frames: int
+    seconds: float
+    fps: float
+
+
+class CullStats(NamedTuple):
+    faces: int
+    culled: int
+    # Total area of the culled polygons, in output pixels.
+    culled_pixels: float
+
+
+class _SpillFile:
+    """An array appended to a file chunk by chunk, then memory-mapped back; see Engine._prepare_chunks."""
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "wb")
+        self.dtype = None
+        self.shape = (0,)
+
+    def append(self, array):
+        array = np.ascontiguousarray(array)
+        self.dtype = array.dtype
+        self.shape = (self.shape[0] + len(array),) + array.shape[1:]
+        array.tofile(self.file)
+
+    def load(self):
+        self.file.close()
+        return np.memmap(self.path, self.dtype, "r", shape=self.shape)
+
+
+class _SvgStream:
+    """Serializes elements straight to a text file, byte for byte like svgwrite would."""
+
+    def __init__(self, fileobj, tiny=False, buffer_size=4096):
+        self.fileobj = fileobj
+        self.tiny = tiny
+        self.buffer_size = buffer_size
+        self.buffer = []
+
+    def begin(self, root):
+        # root is the serialized <svg> element holding only its <defs>.
+        self.fileobj.write('<?xml version="1.0" encoding="utf-8" ?>\n')
+        self.write(root[:-len("</svg>")])
+
+    def end(self):
+        self.write("</svg>")
+        self.flush()
+
+    def group(self, attribs, elements, circle_radius=0, shared_styles=False, symbol=None):
+        # With shared_styles, elements tend to reuse the same style objects,
+        # like batch shader palettes, and each of them is converted once.
+        # Entries keep their style alive, so ids stay unique. Points get a
+        # whole element template per style, with only the position left open.
+        opening = "<g %s" % self._attributes(attribs)
+        empty = True
+        style_strings = {}
+        for tag, points, style in elements:
+            if empty:
+                self.write(opening + ">")
+                empty = False
+            if shared_styles:
+                strings = style_strings.get(id(style))
+                if strings is None:
+                    if len(style_strings) >= 1024:
+                        style_strings.clear()
+                    strings = style_strings[id(style)] = style, self._strings(style), {}
+                attribs = {}
+            else:
+                attribs = dict(style)
+            if isinstance(points, np.ndarray):
+                if self.tiny:
+                    # svgwrite rounds NumPy scalars with NumPy's rounding, not Python's.
+                    points = np.around(points, 4)
+                points = points.tolist()
+            if shared_styles and tag in ("circle", "use"):
+                template = strings[2].get(tag)
+                if template is None:
+                    template = strings[2][tag] = self._point_template(tag, strings[1], circle_radius,
+                                                                      symbol)
+                self.write(template % (self._number(points[0]), self._number(points[1])))
+                continue
+            if tag == "polygon" and isinstance(points, str):
+                attribs["points"] = points
+            elif tag == "polygon":
+                attribs["points"] = " ".join("%s,%s" % (self._number(x), self._number(y))
+                                             for x, y in points)
+            elif tag == "line":
+                (x1, y1), (x2, y2) = points
+                attribs.update(x1=x1, y1=y1, x2=x2, y2=y2)
+            elif tag == "path":
+                attribs["d"] = points
+            elif tag == "use":
+                x, y = points
+                attribs.update({"x": x, "y": y, "xlink:href": symbol})
+            else:
+                cx, cy = points
+                attribs.update(cx=cx, cy=cy, r=circle_radius)
+            if shared_styles:
+                attribs = dict(strings[1], **self._strings(attribs))
+                self.write("<%s %s />" % (tag, self._join(attribs)))
+            else:
+                self.write("<%s %s />" % (tag, self._attributes(attribs)))
+        self.write(opening + " />" if empty else "</g>")
+
+    def _point_template(self, tag, style_strings, circle_radius, symbol):
+        if tag == "circle":
+            attribs = {"cx": "\0", "cy": "\1", "r": circle_radius}
+        else:
+            attribs = {"x": "\0", "xlink:href": symbol, "y": "\1"}
+        text = "<%s %s />" % (tag, self._join(dict(style_strings, **self._strings(attribs))))
+        return text.replace("%", "%%").replace('"\0"', '"%s"').replace('"\1"', '"%s"')
+
+    def write(self, text):
+        self.buffer.append(text)
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        self.fileobj.write("".join(self.buffer))
+        self.buffer = []
+
+    def _number(self, value):
+        if self.tiny and isinstance(value, float):
+            value = round(value, 4)
+        return str(value)
+
+    def _attributes(self, attribs):
+        return self._join(self._strings(attribs))
+
+    @staticmethod
+    def _join(strings):
+        # Same ordering as svgwrite.
+        return " ".join('%s="%s"' % item for item in sorted(strings.items()))
+
+    def _strings(self, attribs):
+        # Same key mangling, empty-value filtering and escaping as svgwrite.
+        items = {}
+        for key, value in attribs.items():
+            items[key.rstrip("_").replace("_", "-")] = value
+        strings = {}
+        for key, value in items.items():
+            if value is None:
+                continue
+            value = self._number(value) if isinstance(value, (int, float)) else str(value)
+            if value:
+                strings[key] = _escape_attribute(value)
+        return strings
+
+
+class _StyleClasses:
+    """Moves the presentation attributes of element styles into shared CSS classes."""
+
+    def __init__(self):
+        self.names = {}  # CSS declarations -> class name
+        self.interned = {}  # id(style) -> (style, interned style); keeps ids unique
+
+    def intern(self, style):
+        """Returns style with its presentation attributes replaced by a class."""
+        entry = self.interned.get(id(style))
+        if entry is not None:
+            return entry[1]
+        rest, declarations = {}, []
+        for key, value in style.items():
+            name = key.rstrip("_").replace("_", "-")
+            if name in presentation_attributes and value is not None and str(value):
+                declarations.append("%s:%s" % (name, value))
+            else:
+                rest[key] = value
+        if declarations:
+            rule = ";".join(sorted(declarations))
+            class_name = self.names.setdefault(rule, "s%d" % len(self.names))
+            classes = [rest.pop(key) for key in ("class", "class_") if rest.get(key)]
+            rest["class_"] = " ".join(classes + [class_name])
+        if len(self.interned) >= 1024:
+            self.interned.clear()
+        self.interned[id(style)] = style, rest
+        return rest
+
+    def css(self):
+        return "\n".join(".%s{%s}" % (name, rule) for rule, name in self.names.items())
+
+
+class _FormattedPolygon(svgwrite.shapes.Polygon):
+    """A polygon whose points attribute was already formatted by _format_points."""
+
+    def __init__(self, points_text, **extra):
+        super(_FormattedPolygon, self).__init__(**extra)
+        self.points_text = points_text
+
+    def points_to_string(self, points):
+        return self.points_text
+
+
+_TRAILING_ZEROS = re.compile(r"\.0+(?=[,\n])|(\.\d*?[1-9])0+(?=[,\n])")
+
+
+def _format_points(points, precision, trim=False):
+    """Formats an (n, 2) coordinate array into a list of "x,y" strings in one pass."""
+    if len(points) == 0:
+        return []
+    precision = max(int(precision), 0)
+    # Adding zero turns the -0.0 left by rounding into 0.0.
+    values = np.around(points, precision) + 0.0
+    text = ("%%.%df,%%.%df\n" % (precision, precision)) * len(values) % tuple(values.ravel().tolist())
+    if trim and precision > 0:
+        text = _TRAILING_ZEROS.sub(r"\1", text)
+    return text.split("\n")[:-1]
+
+
+def _prepare_view(engine, view):
+    # Runs in a worker process; see Engine._prepare_views.
+    return [list(batches) for batches in engine._prepare_scene(view)]
+
+
+_frame_worker = None
+
+
+def _init_frame_worker(engine):
+    global _frame_worker
+    _frame_worker = engine
+
+
+def _prepare_frame(camera):
+    # Runs in a worker process; see Engine._prepare_frames.
+    views = [view._replace(camera=camera) for view in _frame_worker.views]
+    return [[list(batches) for batches in prepared_meshes]
+            for view in views for prepared_meshes in _frame_worker._prepare_regions(view)]
+
+
+_NO_STYLE = {}  # shared by the elements of meshes without a shader; never modified
+
+
+_LENGTH = re.compile(r"\s*([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)\s*(px|in|cm|mm|pt|pc)?\s*$")
+_PIXELS_PER_UNIT = {None: 1.0, "px": 1.0, "in": 96.0, "cm": 96 / 2.54, "mm": 96 / 25.4, "pt": 96 / 72, "pc": 16.0}
+
+
+def _pixels_per_unit(drawing):
+    """Returns the output pixels per user unit of drawing, from its width, height and viewBox.
+
+    Absolute lengths are converted at 96 pixels per inch. The viewBox is
+    fitted as by the default preserveAspectRatio, so the smaller of the
+    horizontal and vertical scales applies.
+    """
+    pixels = []
+    for name in ("width", "height"):
+        match = _LENGTH.match(str(drawing.attribs.get(name, "100%")))
+        if match is None:
+            raise ValueError("the %s of the drawing must be an absolute length, got %r"
+                             % (name, drawing.attribs.get(name, "100%")))
+        pixels.append(float(match.group(1)) * _PIXELS_PER_UNIT[match.group(2)])
+    view_box = drawing.attribs.get("viewBox")
+    if view_box is None:
+        return 1.0
+    _, _, width, height = (float(value) for value in str(view_box).replace(",", " ").split())
+    return min(pixels[0] / width, pixels[1] / height)
+
+
+def _escape_attribute(text):
+    if any(c in text for c in '&<>"\n\r\t'):
+        text = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+        text = text.replace('"', "&quot;").replace("\r", "&#13;").replace("\n", "&#10;")
+        text = text.replace("\t", "&#09;")
+    return text
+
+
 class Engine:
-    def __init__(self, views, precision=10):
+    def __init__(self, views, precision=10, sort_by="mean", number_format="repr", processes=None,
+                 frustum_clip=False, chunk_faces=None, dtype=np.float64, cache_bytes=0,
+                 style_classes=False, point_format="circle", merge_faces=False, global_sort=False,
+                 occlusion_resolution=None, hidden_surface_removal=False, min_face_pixels=0, tiles=None):
+        if sort_by not in ("mean", "max", "min"):
+            raise ValueError("sort_by must be 'mean', 'max' or 'min', got %r" % (sort_by,))
+        if number_format not in ("repr", "fixed", "trimmed"):
+            raise ValueError("number_format must be 'repr', 'fixed' or 'trimmed', got %r"
+                             % (number_format,))
+        if point_format not in ("circle", "path", "use"):
+            raise ValueError("point_format must be 'circle', 'path' or 'use', got %r" % (point_format,))
+        if not np.issubdtype(dtype, np.floating):
+            raise ValueError("dtype must be a floating point type, got %r" % (dtype,))
         self.views = views
         self.precision = precision
+        self.sort_by = sort_by
+        # "repr" writes rounded coordinates the way svgwrite does, one at a time.
+        # "fixed" and "trimmed" format the whole buffer with precision digits,
+        # the latter dropping trailing zeros.
+        self.number_format = number_format
+        # Number of worker processes that prepare views in parallel; None renders serially.
+        self.processes = processes
+        # Clip polygons to the view frustum instead of keeping or dropping them whole.
+        self.frustum_clip = frustum_clip
+        # Meshes with more faces than this are projected and sorted chunk by
+        # chunk through temporary files; None keeps every mesh in memory.
+        # global_sort, tiles, occlusion_resolution and hidden_surface_removal
+        # need whole meshes, so they hold every mesh in memory regardless.
+        self.chunk_faces = chunk_faces
+        # Floating point type of every projected buffer; np.float32 halves their size.
+        self.dtype = np.dtype(dtype)
+        # Memory budget of the cache of prepared meshes; 0 disables it. See _prepare.
+        self.cache_bytes = cache_bytes
+        self._cache = collections.OrderedDict()
+        self._cache_used = 0
+        # Replace the presentation attributes of shaded elements by CSS classes
+        # defined in a <style> element, written after the content when streaming.
+        self.style_classes = style_classes
+        # How meshes with a circle_radius draw their points: a <circle> each,
+        # a <path> of arcs per run of equally styled faces, or a <use> each
+        # that references one shared circle.
+        self.point_format = point_format
+        # Draw runs of consecutive, edge-sharing faces with equal styles as one <path>.
+        self.merge_faces = merge_faces
+        # Sort the faces of all meshes of a view together, emitting a group for
+        # each run of consecutive faces from the same mesh.
+        self.global_sort = global_sort
+        # (width, height), or a single size for both, of a z-buffer that views
+        # are rasterized into to drop faces hidden behind nearer faces; None
+        # emits every face. See _occlusion_pass.
+        if isinstance(occlusion_resolution, int):
+            occlusion_resolution = occlusion_resolution, occlusion_resolution
+        self.occlusion_resolution = occlusion_resolution
+        # Cut every face down to the parts not covered by faces drawn after
+        # it, so nothing is drawn over; see _remove_hidden.
+        self.hidden_surface_removal = hidden_surface_removal
+        # Polygons covering less than this many output pixels, going by the
+        # size and viewBox of the drawing, are merged into their neighbours.
+        # cull_stats then holds a CullStats for the last render; see _cull_small.
+        self.min_face_pixels = min_face_pixels
+        self.cull_stats = None
+        # (columns, rows), or a single count for both, of tiles to split every
+        # view into. Tiles are prepared in parallel with processes, and each
+        # is emitted with its own clip path; see _tile_views.
+        if isinstance(tiles, int):
+            tiles = tiles, tiles
+        self.tiles = tiles
+        if chunk_faces and (global_sort or tiles or occlusion_resolution or hidden_surface_removal):
+            warnings.warn("chunk_faces does not bound memory with global_sort, tiles, occlusion_resolution "
+                          "or hidden_surface_removal, which need whole meshes", stacklevel=2)
 
-    def pull(self, filename, size=(512, 512), viewBox="-0.5 -0.5 1.0 1.0", **extra):
+    def pull(self, filename, size=(512, 512), viewBox="-0.5 -0.5 1.0 1.0", scale=10, **extra):
         drawing = svgwrite.Drawing(filename, size, viewBox=viewBox, **extra)
-        val = self.render_to_drawing(drawing)
+        val = self.render_to_drawing(drawing, scale)
         return val
 
-    def render(self, filename, size=(512, 512), viewBox="-0.5 -0.5 1.0 1.0", **extra):
+    def render(self, filename, size=(512, 512), viewBox="-0.5 -0.5 1.0 1.0", stream=False, **extra):
+        if stream:
+            self.render_stream(filename, size, viewBox=viewBox, **extra)
+            return
         drawing = svgwrite.Drawing(filename, size, viewBox=viewBox, **extra)
         self.return_coords(drawing)
         drawing.save()
-    def return_coords(self, drawing):
-        for view in self.views:
-            projection = np.dot(view.camera.view, view.camera.projection)
 
+    def render_stream(self, file, size=(512, 512), viewBox="-0.5 -0.5 1.0 1.0", **extra):
+        """Writes the SVG text of every element as it is emitted, without building a DOM.
+
+        file is a filename or a writable text file object. The output is the
+        same as render() produces.
+        """
+        self._write_stream(file, self.views, self._prepare_views(), size, viewBox, **extra)
+
+    def render_sequence(self, cameras, filename_pattern, size=(512, 512), viewBox="-0.5 -0.5 1.0 1.0",
+                        **extra):
+        """Streams one SVG file per camera, with that camera replacing the camera of every view.
+
+        cameras may be any iterable, including a generator. filename_pattern is
+        formatted with the frame number, e.g. "frame_{:04d}.svg". With processes
+        set, the workers receive the scenes once and prepare upcoming frames
+        while this process shades and writes the current one. Returns the
+        frame count and throughput as a SequenceStats.
+        """
+        start = time.perf_counter()
+        frames = 0
+        for frame, (views, prepared_views) in enumerate(self._prepare_frames(cameras)):
+            self._write_stream(filename_pattern.format(frame), views, prepared_views, size, viewBox, **extra)
+            frames += 1
+        seconds = time.perf_counter() - start
+        return SequenceStats(frames, seconds, frames / seconds if seconds > 0 else 0.0)
+
+    def clear_cache(self):
+        """Forgets every cached mesh, e.g. after modifying mesh arrays in place."""
+        self._cache.clear()
+        self._cache_used = 0
+
+    def _write_stream(self, file, views, prepared_views, size, viewBox, **extra):
+        # Only the root element and its clip paths go through svgwrite.
+        drawing = svgwrite.Drawing(size=size, viewBox=viewBox, **extra)
+        symbols = self._add_point_symbols(drawing, views)
+        regions = self._regions(views)
+        clip_paths = []
+        for _, clip in regions:
             clip_path = drawing.defs.add(drawing.clipPath())
-            clip_min = view.viewport.minx, view.viewport.miny
-            clip_size = view.viewport.width, view.viewport.height
-            clip_path.add(drawing.rect(clip_min, clip_size))
+            clip_path.add(drawing.rect((clip.minx, clip.miny), (clip.width, clip.height)))
+            clip_paths.append(clip_path.get_funciri())
 
-            for mesh in view.scene.meshes:
-                g = self._create_group(drawing, projection, view.viewport, mesh)
+        fileobj = open(file, "w", encoding="utf-8") if isinstance(file, str) else file
+        try:
+            writer = _SvgStream(fileobj, tiny=drawing.profile == "tiny")
+            writer.begin(drawing.tostring())
+            classes = _StyleClasses() if self.style_classes else None
+            pixel_area = self._start_culling(drawing)
+            for (view, _), clip_path, prepared_meshes in zip(regions, clip_paths, prepared_views):
+                for mesh, batches in self._groups(view, prepared_meshes, pixel_area):
+                    attribs = dict(mesh.style or {})
+                    attribs["clip-path"] = clip_path
+                    shared_styles = mesh.batch_shader is not None or mesh.shader is None
+                    writer.group(attribs, self._emit(mesh, batches, classes), mesh.circle_radius,
+                                 shared_styles, symbols.get(mesh.circle_radius))
+            if classes is not None and classes.names:
+                writer.write(drawing.style(classes.css()).tostring())
+            writer.end()
+        finally:
+            if fileobj is not file:
+                fileobj.close()
+
+    def return_coords(self, drawing):
+        classes = _StyleClasses() if self.style_classes else None
+        symbols = self._add_point_symbols(drawing, self.views)
+        pixel_area = self._start_culling(drawing)
+        for (view, clip), prepared_meshes in zip(self._regions(self.views), self._prepare_views()):
+            clip_path = drawing.defs.add(drawing.clipPath())
+            clip_path.add(drawing.rect((clip.minx, clip.miny), (clip.width, clip.height)))
+
+            for mesh, batches in self._groups(view, prepared_meshes, pixel_area):
+                g = self._create_group(drawing, mesh, batches, classes, symbols.get(mesh.circle_radius))
                 
                 g["clip-path"] = clip_path.get_funciri()
                 drawing.add(g) 
-    def render_to_drawing(self, drawing):
+        if classes is not None and classes.names:
+            drawing.defs.add(drawing.style(classes.css()))
+    def render_to_drawing(self, drawing, scale=10):
+        """Returns the projected faces of every mesh of every view as one PulledFaces.
+
+        Meshes are numbered in order, view after view, and each keeps its own
+        back-to-front order. Coordinates are normalized device coordinates
+        multiplied by scale.
+        """
+        pulled = []
         for view in self.views:
             projection = np.dot(view.camera.view, view.camera.projection)
 
@@ -87,175 +599,1700 @@ class Engine:
             clip_path.add(drawing.rect(clip_min, clip_size))
 
             for mesh in view.scene.meshes:
-                g = self._returnnnn(drawing, projection, view.viewport, mesh)
-                return g 
+                pulled.append(self._returnnnn(drawing, projection, view.viewport, mesh, scale))
+        return PulledFaces.concatenate(pulled)
 
-    def _returnnnn(self, drawing, projection, viewport, mesh):
-        faces = mesh.faces
-        face_idxs = mesh.face_idxs
+    def _returnnnn(self, drawing, projection, viewport, mesh, scale=10):
+        faces, indices, face_offsets, face_ids, _ = self._project(projection, mesh)
+        if indices is not None:
+            faces = faces[indices]
+        faces *= scale
+        return PulledFaces(faces, face_offsets, face_ids, np.zeros(len(face_ids), dtype=np.intp))
 
-        shader = mesh.shader or (lambda face_index, winding: {})
-        default_style = mesh.style or {}
-        # Extend each point to a vec4, then transform to clip space.
-        faces = np.concatenate([faces, np.ones((faces.shape[0], 1))], axis=-1)
-        faces = np.dot(faces, projection)
+    def _project(self, projection, mesh):
+        """Returns the accepted faces of mesh in normalized device coordinates.
+
+        The result is a (faces, indices, face_offsets, face_ids, areas) tuple
+        sorted from back to front, where face_ids maps each output face to its
+        index in mesh and areas holds its doubled signed area, positive when
+        counter-clockwise. For indexed meshes, faces holds every projected
+        vertex and indices the vertex of each output corner; otherwise indices
+        is None.
+        """
+        faces = np.asarray(mesh.faces, dtype=self.dtype)
+        indices = mesh.indices
+        face_offsets = mesh.face_offsets
 
-        # Reject trivially clipped polygons.
-        xyz, w = faces[..., :3], faces[..., 3:]
-       
-        accepted = np.logical_and(np.greater(xyz, -w), np.less(xyz, +w))
-        accepted = np.all(accepted, axis=-1)  # vert is accepted if xyz are all inside
-        degenerate = np.less_equal(w, 0).squeeze()  # vert is bad if its w <= 0
-        for i in range(mesh.num_faces):
-            accepted[face_idxs==i] = np.any(accepted[face_idxs==i])
-            degenerate[face_idxs==i] = np.any(degenerate[face_idxs==i])
-        #accepted = np.array([np.any(accepted[face_idxs==i]) for i in range(mesh.num_faces)]) 
-        #degenerate = np.array([np.any(degenerate[face_idxs==i]) for i in range(mesh.num_faces)])
-
-        accepted = np.logical_and(accepted, np.logical_not(degenerate))
-        faces = faces[accepted] #np.compress(accepted, faces, axis=0)
-        face_idxs = face_idxs[accepted]
-
-        # Apply perspective transformation.
-        xyz, w = faces[..., :3], faces[..., 3:]
-        faces = xyz / w
-      
-        # Sort faces from back to front.
-        sort_order = self._sort_back_to_front(faces, face_idxs, num_faces=mesh.num_faces)
-        
-        faces = faces[sort_order]
-        
-        face_idxs = face_idxs[sort_order]
-        data = []
-        _, idx = np.unique(face_idxs, return_index=True)
-        num_faces_order = face_idxs[np.sort(idx)].astype(int).tolist()
-        
-        
-
-        for i in num_faces_order:
-            
-            face = faces[face_idxs==i]
-
-            face *= 10
-            exp = [{'x':data[0], 'y':data[1], 'z':data[2]}for data in face]
-            data.append(exp)
-        return data
-
-    def _create_group(self, drawing, projection, viewport, mesh):
-        faces = mesh.faces
-        face_idxs = mesh.face_idxs
-
-        shader = mesh.shader or (lambda face_index, winding: {})
-        default_style = mesh.style or {}
         # Extend each point to a vec4, then transform to clip space.
-        faces = np.concatenate([faces, np.ones((faces.shape[0], 1))], axis=-1)
-        faces = np.dot(faces, projection)
+        faces = np.concatenate([faces, np.ones((faces.shape[0], 1), dtype=self.dtype)], axis=-1)
+        faces = np.dot(faces, np.asarray(projection, dtype=self.dtype))
 
-        # Reject trivially clipped polygons.
-        xyz, w = faces[..., :3], faces[..., 3:]
-       
-        accepted = np.logical_and(np.greater(xyz, -w), np.less(xyz, +w))
-        accepted = np.all(accepted, axis=-1)  # vert is accepted if xyz are all inside
-        degenerate = np.less_equal(w, 0).squeeze()  # vert is bad if its w <= 0
-        for i in range(mesh.num_faces):
-            accepted[face_idxs==i] = np.any(accepted[face_idxs==i])
-            degenerate[face_idxs==i] = np.any(degenerate[face_idxs==i])
-        #accepted = np.array([np.any(accepted[face_idxs==i]) for i in range(mesh.num_faces)]) 
-        #degenerate = np.array([np.any(degenerate[face_idxs==i]) for i in range(mesh.num_faces)])
-
-        accepted = np.logical_and(accepted, np.logical_not(degenerate))
-        faces = faces[accepted] #np.compress(accepted, faces, axis=0)
-        face_idxs = face_idxs[accepted]
-
-        # Apply perspective transformation.
+        if self.frustum_clip:
+            # Clipping creates new corners, so indexed meshes are expanded first.
+            if indices is not None:
+                faces, indices = faces[indices], None
+            faces, face_offsets, face_ids = self._clip_to_frustum(faces, face_offsets)
+        else:
+            # Reject trivially clipped polygons.
+            xyz, w = faces[..., :3], faces[..., 3:]
+            accepted = np.logical_and(np.greater(xyz, -w), np.less(xyz, +w))
+            accepted = np.all(accepted, axis=-1)  # vert is accepted if xyz are all inside
+            degenerate = np.less_equal(w[:, 0], 0)  # vert is bad if its w <= 0
+            if indices is not None:
+                accepted, degenerate = accepted[indices], degenerate[indices]
+            accepted = self._count_per_face(accepted, face_offsets) > 0
+            degenerate = self._count_per_face(degenerate, face_offsets) > 0
+
+            face_ids = np.flatnonzero(np.logical_and(accepted, np.logical_not(degenerate)))
+            if indices is None:
+                faces, face_offsets = self._gather_faces(faces, face_offsets, face_ids)
+            else:
+                indices, face_offsets = self._gather_faces(indices, face_offsets, face_ids)
+
+        # Apply perspective transformation. Indexed meshes project every vertex
+        # once, including those only used by rejected faces.
         xyz, w = faces[..., :3], faces[..., 3:]
-        faces = xyz / w
-      
+        with np.errstate(divide="ignore", invalid="ignore"):
+            faces = xyz / w
+
+        corners = faces if indices is None else faces[indices]
+        areas = self._signed_areas(corners[:, :2], face_offsets)
+
+        # Cull polygons facing away from the camera; lines have no facing.
+        if mesh.cull_backfaces:
+            kept = np.flatnonzero(np.logical_or(areas > 0, np.diff(face_offsets) < 3))
+            if indices is not None:
+                indices, _ = self._gather_faces(indices, face_offsets, kept)
+            corners, face_offsets = self._gather_faces(corners, face_offsets, kept)
+            if indices is None:
+                faces = corners
+            face_ids, areas = face_ids[kept], areas[kept]
+
         # Sort faces from back to front.
-        sort_order = self._sort_back_to_front(faces, face_idxs, num_faces=mesh.num_faces)
-        
-        faces = faces[sort_order]
-        
-        face_idxs = face_idxs[sort_order]
-        data = []
-        _, idx = np.unique(face_idxs, return_index=True)
-        num_faces_order = face_idxs[np.sort(idx)].astype(int).tolist()
-        
-        
-
-        # for i in num_faces_order:
-            
-        #     face = faces[face_idxs==i]
-
-        #     face *= 10
-        #     exp = [{'x':data[0], 'y':data[1], 'z':data[2]}for data in face]
-        #     data.append(exp)
-        # print(data)
-        # breakpoint()
+        sort_order = self._sort_back_to_front(corners[:, 2], face_offsets)
+        if indices is None:
+            faces, face_offsets = self._gather_faces(faces, face_offsets, sort_order)
+        else:
+            indices, face_offsets = self._gather_faces(indices, face_offsets, sort_order)
+        return faces, indices, face_offsets, face_ids[sort_order], areas[sort_order]
+
+    def _prepare_views(self):
+        """Yields, for each region of the views in order, the _prepare_batches result of each mesh.
+
+        The regions are the views themselves, or their tiles; see _regions.
+        With processes set, views or tiles are prepared in a process pool.
+        Only the geometry travels to the workers; shaders always run in this
+        process, as do meshes prepared chunk by chunk, so their batches are
+        streamed as they are emitted; see _streamed.
+        """
+        if not self.processes or (len(self.views) < 2 and not self.tiles):
+            for view in self.views:
+                yield from self._prepare_regions(view)
+            return
+
+        worker = self._worker_copy()
+        with concurrent.futures.ProcessPoolExecutor(self.processes) as executor:
+            if not self.tiles:
+                for view, prepared_meshes in zip(self.views, executor.map(_prepare_view, itertools.repeat(worker),
+                                                                           self._shaderless_views())):
+                    yield self._with_streamed(view, prepared_meshes)
+                return
+            for view in self.views:
+                tile_views, face_maps = zip(*self._tile_views(view))
+                for prepared_meshes, tile_face_maps in zip(
+                        executor.map(_prepare_view, itertools.repeat(worker), tile_views), face_maps):
+                    yield self._map_tile_faces(prepared_meshes, tile_face_maps)
+
+    def _prepare_frames(self, cameras):
+        """Yields (views, prepared_views) for each camera, in order; see render_sequence."""
+        if not self.processes:
+            for camera in cameras:
+                views = [view._replace(camera=camera) for view in self.views]
+                yield views, [prepared for view in views for prepared in self._prepare_regions(view)]
+            return
+
+        # Workers keep the scenes from their initializer, so each task only carries a camera.
+        worker = self._worker_copy()
+        worker.views = self._shaderless_views()
+        pending = collections.deque()
+        with concurrent.futures.ProcessPoolExecutor(self.processes, initializer=_init_frame_worker,
+                                                    initargs=(worker,)) as executor:
+            for camera in itertools.chain(cameras, [None]):
+                if camera is not None:
+                    pending.append((camera, executor.submit(_prepare_frame, camera)))
+                # Keep a bounded number of frames in flight, then drain at the end.
+                while pending and (camera is None or len(pending) > 2 * self.processes):
+                    camera_done, future = pending.popleft()
+                    views = [view._replace(camera=camera_done) for view in self.views]
+                    prepared_views = future.result()
+                    if not self.tiles:
+                        prepared_views = [self._with_streamed(view, prepared_meshes)
+                                          for view, prepared_meshes in zip(views, prepared_views)]
+                    yield views, prepared_views
+
+    def _shaderless_views(self):
+        # Shaders are often lambdas, which cannot be pickled for a worker
+        # process. Streamed meshes are sent empty; see _with_streamed.
+        empty = dict(faces=np.zeros((0, 3)), face_offsets=np.zeros(1, dtype=np.intp), indices=None)
+        return [view._replace(scene=Scene([mesh._replace(shader=None, batch_shader=None,
+                                                         **(empty if self._streamed(mesh) else {}))
+                                           for mesh in view.scene.meshes]))
+                for view in self.views]
+
+    def _streamed(self, mesh):
+        """Tells whether view preparation leaves mesh to its chunks, as a generator of batches.
+
+        Such meshes are kept out of worker processes, whose results are
+        pickled whole, and prepared by _with_streamed instead.
+        """
+        return bool(self.chunk_faces and mesh.num_faces > self.chunk_faces and not mesh.wireframe
+                    and not self.tiles and not self.occlusion_resolution and not self.hidden_surface_removal)
+
+    def _with_streamed(self, view, prepared_meshes):
+        # Replaces the worker results for the empty streamed meshes of view.
+        return [self._prepare_chunks(view, mesh) if self._streamed(mesh) else batches
+                for mesh, batches in zip(view.scene.meshes, prepared_meshes)]
+
+    def _worker_copy(self):
+        """Returns a view-less copy of this engine that is cheap to send to a worker."""
+        worker = copy.copy(self)
+        worker.views = []
+        worker.processes = None
+        worker.cache_bytes = 0
+        worker._cache = collections.OrderedDict()
+        worker._cache_used = 0
+        return worker
+
+    def _prepare(self, view, mesh):
+        """Computes everything about the faces of mesh that does not need its shader.
+
+        Returns (points, face_offsets, face_ids, windings, depths), sorted back
+        to front. points holds the corners in viewport space, either as a
+        rounded array or, for the bulk number formats, as a list of "x,y"
+        strings. depths holds the sort key of each face.
+
+        With cache_bytes set, results are kept in a least recently used cache
+        keyed by the identity of the mesh arrays, the camera matrices, the
+        viewport and the engine options, so re-rendering with other shaders
+        or styles skips the geometry work. Arrays modified in place are not
+        detected; call clear_cache() after doing so.
+        """
+        projection = np.dot(view.camera.view, view.camera.projection)
+        if not self.cache_bytes:
+            return self._finish(view.viewport, *self._project(projection, self._drawn_mesh(projection, mesh)))
+
+        key = (id(mesh.faces), id(mesh.face_offsets), id(mesh.indices), mesh.cull_backfaces,
+               mesh.wireframe, projection.tobytes(), view.viewport, self.precision, self.sort_by, self.number_format,
+               self.frustum_clip, self.dtype, bool(self.min_face_pixels))
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry[0]
+
+        prepared = self._finish(view.viewport, *self._project(projection, self._drawn_mesh(projection, mesh)))
+        points = prepared[0]
+        size = sum(array.nbytes for array in prepared[1:])
+        if isinstance(points, np.ndarray):
+            size += points.nbytes
+        else:
+            size += sum(map(len, points)) + 56 * len(points)  # approximate str overhead
+        if size <= self.cache_bytes:
+            # The entry keeps the mesh arrays alive, so their ids cannot be reused.
+            self._cache[key] = prepared, size, (mesh.faces, mesh.face_offsets, mesh.indices)
+            self._cache_used += size
+            while self._cache_used > self.cache_bytes:
+                _, (_, evicted, _) = self._cache.popitem(last=False)
+                self._cache_used -= evicted
+        return prepared
+
+    def _drawn_mesh(self, projection, mesh):
+        """Returns the mesh whose faces are drawn for mesh: its edges in wireframe mode, else itself."""
+        return self._edge_mesh(projection, mesh) if mesh.wireframe else mesh
+
+    def _edge_mesh(self, projection, mesh):
+        """Returns the unique edges of mesh as an indexed mesh of two-corner faces.
+
+        Edges are numbered in order of first appearance. Vertices of
+        non-indexed meshes are identified by position. With cull_backfaces,
+        only the edges of faces that pass culling under projection are kept.
+        """
+        face_offsets = np.asarray(mesh.face_offsets)
+        if mesh.indices is None:
+            vertices, vertex_ids = np.unique(mesh.faces, axis=0, return_inverse=True)
+            vertex_ids = vertex_ids.ravel()
+        else:
+            vertices, vertex_ids = mesh.faces, np.asarray(mesh.indices)
+        if mesh.cull_backfaces:
+            face_ids = np.sort(self._project(projection, mesh)[3])
+        else:
+            # Faces without corners, e.g. from gaps in from_face_idxs labels,
+            # have no edges and would break the wrap-around below.
+            face_ids = np.flatnonzero(np.diff(face_offsets) > 0)
+        vertex_ids, face_offsets = self._gather_faces(vertex_ids, face_offsets, face_ids)
+
+        # Each corner starts an edge to the next corner of its face, except
+        # the last corner of two-corner faces.
+        following = np.arange(1, len(vertex_ids) + 1)
+        following[face_offsets[1:] - 1] = face_offsets[:-1]
+        has_edge = np.ones(len(vertex_ids), dtype=bool)
+        counts = np.diff(face_offsets)
+        has_edge[face_offsets[1:][counts == 2] - 1] = False
+        a, b = vertex_ids[has_edge], vertex_ids[following[has_edge]]
+        a, b = np.minimum(a, b)[a != b], np.maximum(a, b)[a != b]
+
+        # Dedup undirected edges by a single integer key per vertex pair.
+        keys = a.astype(np.int64) * len(vertices) + b
+        _, unique = np.unique(keys, return_index=True)
+        unique.sort()
+        indices = np.stack([a[unique], b[unique]], axis=-1).reshape(-1)
+        return mesh._replace(faces=vertices, face_offsets=np.arange(0, len(indices) + 1, 2),
+                             indices=indices, cull_backfaces=False)
+
+    def _finish(self, viewport, faces, indices, face_offsets, face_ids, areas, depths=None):
+        """Turns a _project result into a _prepare result for viewport.
+
+        depths, if given, replaces the sort keys computed from the corners.
+        """
         # Apply viewport transform to X and Y.
         faces[..., 0:1] = (1.0 + faces[..., 0:1]) * viewport.width / 2
         faces[..., 1:2] = (1.0 - faces[..., 1:2]) * viewport.height / 2
         faces[..., 0:1] += viewport.minx
         faces[..., 1:2] += viewport.miny
 
-        
-       
-        # Compute the winding direction of each polygon.
-        windings = np.zeros(mesh.num_faces)
-        for i in num_faces_order:
-            
-            vertices = faces[face_idxs==i]
-       
-            if vertices.shape[0] == 3:
-                normals = np.cross(vertices[2] - vertices[0], vertices[1] - vertices[0])
-                
-                np.copyto(windings, normals[2])
+        # Gather the corners of indexed meshes for emission.
+        if indices is not None:
+            faces = faces[indices]
 
-        group = drawing.g(**default_style)
+        # The winding of each polygon is its doubled signed area in viewport
+        # units, positive for polygons facing the camera.
+        windings = areas * self.dtype.type(viewport.width * viewport.height / 4)
+        if depths is None:
+            depths = self._face_depths(faces[:, 2], face_offsets)
 
-        # Create circles.
-        if mesh.circle_radius > 0:
-            for face_index in range(mesh.num_faces):
-                face = faces[face_idxs==face_index]
-                if len(face.shape[0]) == 0:
-                    continue
-                style = shader(sort_order[face_index], 0)
-                if style is None:
+        # Round or format all corners at once; faces below are slices of this.
+        if self.min_face_pixels:
+            # Snapped and formatted for the drawing at emission; see _cull_small.
+            points = faces[:, :2]
+        elif self.number_format != "repr":
+            points = _format_points(faces[:, :2], self.precision, self.number_format == "trimmed")
+        else:
+            # svgwrite writes repr(float(x)), so round narrower types as float64
+            # to keep their text short.
+            points = np.around(faces[:, :2].astype(np.float64, copy=False), self.precision)
+        return points, face_offsets, face_ids, windings, depths
+
+    def _regions(self, views):
+        """Returns the (view, clip) pair of every region that is prepared and emitted on its own.
+
+        Without tiles, each view is one region, clipped to its viewport.
+        Otherwise each tile is, row by row, clipped to its part of the viewport.
+        """
+        if not self.tiles:
+            return [(view, view.viewport) for view in views]
+        columns, rows = self.tiles
+        regions = []
+        for view in views:
+            width, height = view.viewport.width / columns, view.viewport.height / rows
+            for row in range(rows):
+                for column in range(columns):
+                    clip = Viewport(view.viewport.minx + column * width, view.viewport.miny + row * height,
+                                    width, height)
+                    regions.append((view, clip))
+        return regions
+
+    def _prepare_regions(self, view):
+        """Returns the _prepare_scene result of each region of view; see _regions."""
+        if not self.tiles:
+            return [self._prepare_scene(view)]
+        # Tile meshes are temporary, so they bypass the cache.
+        worker = self._worker_copy()
+        return [self._map_tile_faces(worker._prepare_scene(tile_view), face_maps)
+                for tile_view, face_maps in self._tile_views(view)]
+
+    def _tile_views(self, view):
+        """Splits view into a view per tile, returning (tile_view, face_maps) pairs row by row.
+
+        Every mesh is projected once here, and each face goes to each tile
+        its bounding box overlaps, widened by the circle radius for points.
+        A tile view keeps the camera and viewport of view, but each of its
+        meshes only holds those faces, in their original order, so the tile
+        sorts them as the whole view would. face_maps holds, per mesh, the
+        face of the drawn mesh behind each tile mesh face. Tile meshes carry
+        no shaders, as they are emitted with the meshes of view.
+
+        Strokes reaching past the bounding box of their face into another
+        tile are cut off by its clip path.
+        """
+        columns, rows = self.tiles
+        projection = np.dot(view.camera.view, view.camera.projection)
+        tile_meshes = [[] for _ in range(columns * rows)]
+        face_maps = [[] for _ in range(columns * rows)]
+        for mesh in view.scene.meshes:
+            drawn = self._drawn_mesh(projection, mesh)
+            faces, indices, face_offsets, face_ids, _ = self._project(projection, drawn)
+            corners = faces if indices is None else faces[indices]
+            boxes = self._bounding_boxes(corners[:, :2], face_offsets)
+            # Flip y, as rows go down the viewport, and pad by the radius in NDC.
+            padding = np.array([2 / view.viewport.width, 2 / view.viewport.height]) * mesh.circle_radius
+            boxes = np.concatenate([boxes[:, [0]], -boxes[:, [3]], boxes[:, [2]], -boxes[:, [1]]], axis=-1)
+            boxes += np.concatenate([-padding, padding])
+            owners, tiles = self._box_cells(boxes, -1, (2 / columns, 2 / rows), columns, rows)
+            order = np.argsort(tiles, kind="stable")
+            owners, tiles = owners[order], tiles[order]
+            bounds = np.searchsorted(tiles, np.arange(columns * rows + 1))
+
+            drawn_faces = np.asarray(drawn.faces)
+            drawn_offsets = np.asarray(drawn.face_offsets)
+            for tile, (first, last) in enumerate(zip(bounds[:-1], bounds[1:])):
+                face_map = np.sort(face_ids[owners[first:last]])
+                if drawn.indices is None:
+                    tile_faces, tile_offsets = self._gather_faces(drawn_faces, drawn_offsets, face_map)
+                    tile_indices = None
+                else:
+                    tile_indices, tile_offsets = self._gather_faces(np.asarray(drawn.indices), drawn_offsets,
+                                                                    face_map)
+                    vertices, tile_indices = np.unique(tile_indices, return_inverse=True)
+                    tile_faces, tile_indices = drawn_faces[vertices], tile_indices.reshape(-1)
+                tile_meshes[tile].append(drawn._replace(faces=tile_faces, face_offsets=tile_offsets,
+                                                        indices=tile_indices, shader=None, batch_shader=None,
+                                                        wireframe=False))
+                face_maps[tile].append(face_map)
+        return [(view._replace(scene=Scene(meshes)), maps) for meshes, maps in zip(tile_meshes, face_maps)]
+
+    def _map_tile_faces(self, prepared_meshes, face_maps):
+        # Turns the face ids of prepared tile meshes back into those of the view's meshes.
+        return [self._mapped_batches(batches, face_map) for batches, face_map in zip(prepared_meshes, face_maps)]
+
+    @staticmethod
+    def _mapped_batches(batches, face_map):
+        for points, face_offsets, face_ids, windings, depths in batches:
+            yield points, face_offsets, face_map[face_ids], windings, depths
+
+    def _prepare_scene(self, view):
+        """Returns the _prepare_batches result of each mesh of view.
+
+        With occlusion_resolution or hidden_surface_removal set, every mesh
+        of the view is projected first, then faces that the z-buffer finds
+        hidden are dropped and the rest are cut down to their visible parts,
+        respectively. This bypasses the cache and chunking, as it needs all
+        meshes at once.
+        """
+        if not self.occlusion_resolution and not self.hidden_surface_removal:
+            return (self._prepare_batches(view, mesh) for mesh in view.scene.meshes)
+
+        projection = np.dot(view.camera.view, view.camera.projection)
+        projected = [self._project(projection, self._drawn_mesh(projection, mesh)) for mesh in view.scene.meshes]
+        if self.occlusion_resolution:
+            kept_faces = self._occlusion_pass(projected)
+            for i, ((faces, indices, face_offsets, face_ids, areas), kept) in enumerate(zip(projected, kept_faces)):
+                if indices is None:
+                    faces, kept_offsets = self._gather_faces(faces, face_offsets, kept)
+                else:
+                    indices, kept_offsets = self._gather_faces(indices, face_offsets, kept)
+                projected[i] = faces, indices, kept_offsets, face_ids[kept], areas[kept]
+        if self.hidden_surface_removal:
+            projected = self._remove_hidden(projected)
+        return [[self._finish(view.viewport, *result)] for result in projected]
+
+    def _occlusion_pass(self, projected):
+        """Returns, for each _project result, the indices of its faces that may be visible.
+
+        All polygons are triangulated, see _triangulate, and rasterized
+        together into a z-buffer of occlusion_resolution, sampling pixel
+        centers. Each pixel keeps the nearest face, ties going to the face
+        drawn last. A polygon is kept if it owns at least one pixel, or if it
+        covers no pixel center at all, as nothing is known about it then.
+        Lines and points neither occlude nor get occluded.
+        """
+        width, height = self.occlusion_resolution
+        if not projected:
+            return []
+        face_counts = [len(result[3]) for result in projected]
+        first_ids = np.concatenate([[0], np.cumsum(face_counts)])
+
+        triangles, triangle_faces = [], []
+        for (faces, indices, face_offsets, _, _), first_id in zip(projected, first_ids.tolist()):
+            corners = faces if indices is None else faces[indices]
+            triangle_corners, face_of_triangle = self._triangulate(corners[:, :2], face_offsets)
+            triangles.append(corners[triangle_corners])
+            triangle_faces.append(face_of_triangle + first_id)
+        triangles = np.concatenate(triangles)
+        triangle_faces = np.concatenate(triangle_faces)
+
+        # Move to pixel units, and find the pixel centers within each bounding box.
+        x = (triangles[..., 0] + 1) * (width / 2)
+        y = (1 - triangles[..., 1]) * (height / 2)
+        x0 = np.clip(np.ceil(x.min(axis=1) - 0.5), 0, width).astype(np.intp)
+        x1 = np.clip(np.floor(x.max(axis=1) - 0.5) + 1, 0, width).astype(np.intp)
+        y0 = np.clip(np.ceil(y.min(axis=1) - 0.5), 0, height).astype(np.intp)
+        y1 = np.clip(np.floor(y.max(axis=1) - 0.5) + 1, 0, height).astype(np.intp)
+        columns = np.maximum(x1 - x0, 0)
+        samples = columns * np.maximum(y1 - y0, 0)
+
+        depth_buffer = np.full(width * height, np.inf)
+        face_buffer = np.full(width * height, -1, dtype=np.intp)
+        sampled = np.zeros(first_ids[-1], dtype=bool)
+        # Rasterize in batches of about four million samples to bound memory.
+        sample_ends = np.cumsum(samples)
+        start = 0
+        while start < len(samples):
+            done = sample_ends[start - 1] if start else 0
+            end = max(int(np.searchsorted(sample_ends, done + (1 << 22), "right")), start + 1)
+            self._rasterize(x[start:end], y[start:end], triangles[start:end, :, 2], triangle_faces[start:end],
+                            x0[start:end], y0[start:end], columns[start:end], samples[start:end], width,
+                            depth_buffer, face_buffer, sampled)
+            start = end
+
+        visible = np.zeros(first_ids[-1], dtype=bool)
+        visible[face_buffer[face_buffer >= 0]] = True
+        polygon = np.concatenate([np.diff(result[2]) > 2 for result in projected])
+        kept = np.logical_or(visible, np.logical_not(np.logical_and(polygon, sampled)))
+        return [np.flatnonzero(kept[first:last]) for first, last in zip(first_ids[:-1], first_ids[1:])]
+
+    def _rasterize(self, x, y, z, face_ids, x0, y0, columns, samples, width, depth_buffer, face_buffer,
+                   sampled):
+        """Writes triangles into the z-buffer; see _occlusion_pass."""
+        triangle = np.repeat(np.arange(len(samples)), samples)
+        index = self._ranges(np.zeros(len(samples), dtype=np.intp), samples)
+        px = x0[triangle] + index % columns[triangle]
+        py = y0[triangle] + index // columns[triangle]
+        sx, sy = px + 0.5, py + 0.5
+
+        # Barycentric weights from edge functions; either winding counts.
+        ax, bx, cx = (corner[triangle] for corner in x.T)
+        ay, by, cy = (corner[triangle] for corner in y.T)
+        area = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+        w0 = (bx - sx) * (cy - sy) - (by - sy) * (cx - sx)
+        w1 = (cx - sx) * (ay - sy) - (cy - sy) * (ax - sx)
+        w2 = (ax - sx) * (by - sy) - (ay - sy) * (bx - sx)
+        sign = np.sign(area)
+        inside = (area != 0) & (w0 * sign >= 0) & (w1 * sign >= 0) & (w2 * sign >= 0)
+        triangle, w0, w1, w2, area = triangle[inside], w0[inside], w1[inside], w2[inside], area[inside]
+        pixel = (py * width + px)[inside]
+        depth = (w0 * z[triangle, 0] + w1 * z[triangle, 1] + w2 * z[triangle, 2]) / area
+        face = face_ids[triangle]
+        sampled[face] = True
+
+        # Keep the nearest depth per pixel, forgetting the faces of pixels
+        # that got nearer, then let the face drawn last win among the nearest.
+        face_buffer[pixel[depth < depth_buffer[pixel]]] = -1
+        np.minimum.at(depth_buffer, pixel, depth)
+        nearest = depth == depth_buffer[pixel]
+        np.maximum.at(face_buffer, pixel[nearest], face[nearest])
+
+    def _remove_hidden(self, projected):
+        """Cuts the faces of _project results down to the fragments that stay visible.
+
+        Faces are taken in the order they are drawn: mesh by mesh, or by
+        depth across meshes with global_sort. Every polygon and line loses
+        the parts covered by polygons drawn after it, so the fragments show
+        what painting the faces would, without overdraw. Points are passed
+        through. Returns a (faces, None, face_offsets, face_ids, areas,
+        depths) tuple per result, where each fragment keeps the face id, area
+        and sort key of its face, so fragments stay in their faces' order.
+
+        Covering polygons are subtracted as convex polygons; non-convex ones
+        are split into triangles first, see _triangulate.
+        Polygons must not intersect themselves. A spatial grid limits the
+        subtracted pairs to those whose bounding boxes overlap.
+        """
+        if not projected:
+            return []
+        corners = np.concatenate([faces if indices is None else faces[indices]
+                                  for faces, indices, _, _, _ in projected])
+        counts = [np.diff(face_offsets) for _, _, face_offsets, _, _ in projected]
+        mesh_ids = np.repeat(np.arange(len(counts)), [len(c) for c in counts])
+        positions = np.concatenate([np.arange(len(c)) for c in counts])
+        counts = np.concatenate(counts)
+        face_offsets = np.zeros(len(counts) + 1, dtype=np.intp)
+        np.cumsum(counts, out=face_offsets[1:])
+
+        # Rank the faces in drawing order; see _groups.
+        depths = self._face_depths(corners[:, 2], face_offsets)
+        order = np.arange(len(counts))
+        if self.global_sort:
+            order = np.lexsort((order, mesh_ids, -depths))
+        ranks = np.empty(len(order), dtype=np.intp)
+        ranks[order] = np.arange(len(order))
+
+        # Split polygons with a reflex corner into triangles. The rest, and
+        # lines, are subtracted from as they are.
+        xy = corners[:, :2]
+        following = np.arange(1, len(xy) + 1)
+        following[face_offsets[1:] - 1] = face_offsets[:-1]
+        preceding = np.empty_like(following)
+        preceding[following] = np.arange(len(xy))
+        incoming, outgoing = xy - xy[preceding], xy[following] - xy
+        turns = incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]
+        areas = self._signed_areas(xy, face_offsets)
+        reflex = self._count_per_face(turns * np.repeat(areas, counts) < 0, face_offsets) > 0
+        split = np.logical_and(reflex, counts > 3)
+        whole = np.flatnonzero(np.logical_and(counts >= 2, np.logical_not(split)))
+        split = np.flatnonzero(split)
+        element_corners, element_offsets = self._gather_faces(corners, face_offsets, whole)
+        split_corners, split_offsets = self._gather_faces(corners, face_offsets, split)
+        triangles, triangle_faces = self._triangulate(split_corners[:, :2], split_offsets)
+        element_corners = np.concatenate([element_corners, split_corners[triangles.reshape(-1)]])
+        element_offsets = np.concatenate([element_offsets, element_offsets[-1] + 3 * np.arange(1, len(triangles) + 1)])
+        element_faces = np.concatenate([whole, split[triangle_faces]])
+        element_lines = np.diff(element_offsets) == 2
+
+        # Covering polygons, as one inward-facing half-plane per edge.
+        element_areas = self._signed_areas(element_corners[:, :2], element_offsets)
+        occluders = np.flatnonzero(np.logical_and(np.logical_not(element_lines), element_areas != 0))
+        occluder_xy, occluder_offsets = self._gather_faces(element_corners[:, :2], element_offsets, occluders)
+        following = np.arange(1, len(occluder_xy) + 1)
+        following[occluder_offsets[1:] - 1] = occluder_offsets[:-1]
+        edges = occluder_xy[following] - occluder_xy
+        orientation = np.repeat(np.sign(element_areas[occluders]), np.diff(occluder_offsets))
+        normals = np.stack([-edges[:, 1], edges[:, 0]], axis=-1) * orientation[:, np.newaxis]
+        constants = -np.einsum("ij,ij->i", normals, occluder_xy)
+
+        # Each element is subtracted from by the occluders drawn after it.
+        element_boxes = self._bounding_boxes(element_corners[:, :2], element_offsets)
+        occluder_boxes = element_boxes[occluders]
+        pairs, candidates = self._grid_pairs(element_boxes, occluder_boxes)
+        later = ranks[element_faces[occluders[candidates]]] > ranks[element_faces[pairs]]
+        pairs, candidates = pairs[later], candidates[later]
+        candidate_offsets = np.searchsorted(pairs, np.arange(len(element_faces) + 1))
+
+        # Subtract one occluder from every fragment per round. A fragment
+        # holds the element it came from, and a cursor into its candidates.
+        tolerance = np.sqrt(np.finfo(corners.dtype).eps)
+        fragment_corners, fragment_offsets = element_corners, element_offsets
+        sources = np.arange(len(element_faces))
+        cursors = np.zeros(len(sources), dtype=np.intp)
+        done = []
+        while len(sources):
+            left = candidate_offsets[sources + 1] - candidate_offsets[sources] - cursors
+            finished = np.flatnonzero(left == 0)
+            done.append(self._gather_faces(fragment_corners, fragment_offsets, finished) + (sources[finished],))
+            active = np.flatnonzero(left > 0)
+            fragment_corners, fragment_offsets = self._gather_faces(fragment_corners, fragment_offsets, active)
+            sources, cursors = sources[active], cursors[active]
+            occluder = candidates[candidate_offsets[sources] + cursors]
+            cursors += 1
+            if not len(sources):
+                break
+
+            boxes = self._bounding_boxes(fragment_corners[:, :2], fragment_offsets)
+            hit = np.logical_and(np.all(boxes[:, :2] < occluder_boxes[occluder, 2:], axis=-1),
+                                 np.all(occluder_boxes[occluder, :2] < boxes[:, 2:], axis=-1))
+            missed, hit = np.flatnonzero(np.logical_not(hit)), np.flatnonzero(hit)
+            missed_corners, missed_offsets = self._gather_faces(fragment_corners, fragment_offsets, missed)
+            hit_corners, hit_offsets = self._gather_faces(fragment_corners, fragment_offsets, hit)
+            pieces, piece_offsets, piece_ids = self._subtract_convex(
+                hit_corners, hit_offsets, element_lines[sources[hit]], normals, constants,
+                occluder_offsets[occluder[hit]], np.diff(occluder_offsets)[occluder[hit]], tolerance)
+            fragment_corners = np.concatenate([missed_corners, pieces])
+            fragment_offsets = np.concatenate([missed_offsets, missed_offsets[-1] + piece_offsets[1:]])
+            sources = np.concatenate([sources[missed], sources[hit][piece_ids]])
+            cursors = np.concatenate([cursors[missed], cursors[hit][piece_ids]])
+
+        # Points, then the fragments of every face, back in face order.
+        points = np.flatnonzero(counts == 1)
+        point_corners, point_offsets = self._gather_faces(corners, face_offsets, points)
+        done.append((point_corners, point_offsets, None))
+        fragment_faces = np.concatenate([element_faces[sources] for _, _, sources in done[:-1]] + [points])
+        fragment_corners = np.concatenate([corners for corners, _, _ in done])
+        fragment_offsets = np.zeros(len(fragment_faces) + 1, dtype=np.intp)
+        np.cumsum(np.concatenate([np.diff(offsets) for _, offsets, _ in done]), out=fragment_offsets[1:])
+        order = np.lexsort((np.arange(len(fragment_faces)), positions[fragment_faces], mesh_ids[fragment_faces]))
+        fragment_corners, fragment_offsets = self._gather_faces(fragment_corners, fragment_offsets, order)
+        fragment_faces = fragment_faces[order]
+
+        results = []
+        bounds = np.searchsorted(mesh_ids[fragment_faces], np.arange(len(projected) + 1))
+        for (_, _, _, face_ids, areas), first, last in zip(projected, bounds[:-1], bounds[1:]):
+            start, end = fragment_offsets[first], fragment_offsets[last]
+            mesh_faces = positions[fragment_faces[first:last]]
+            results.append((fragment_corners[start:end], None, fragment_offsets[first:last + 1] - start,
+                            face_ids[mesh_faces], areas[mesh_faces], depths[fragment_faces[first:last]]))
+        return results
+
+    @classmethod
+    def _subtract_convex(cls, faces, face_offsets, lines, normals, constants, first_edges, edge_counts, tolerance):
+        """Subtracts a convex polygon from each face.
+
+        The polygon of face i has edge_counts[i] edges, starting at
+        first_edges[i] in normals and constants, which give the half-plane
+        dot(normal, xy) + constant >= 0 inside each edge. The part of the
+        face outside edge k but inside the edges before it forms piece k, so
+        pieces of convex faces are convex. Two-corner faces, flagged in
+        lines, are cut as segments. Faces that the polygon covers by no more
+        than tolerance times their area or length are returned whole.
+
+        Returns (faces, face_offsets, face_ids) of the pieces, where face_ids
+        holds the face each piece came from, in increasing order.
+        """
+        sizes = cls._face_sizes(faces, face_offsets, lines)
+        degenerate = np.all(normals == 0, axis=-1)
+        inner, inner_offsets, inner_ids = faces, face_offsets, np.arange(len(face_offsets) - 1)
+        pieces = []
+        for edge in range(int(edge_counts.max(initial=0))):
+            plane = first_edges[inner_ids] + np.minimum(edge, edge_counts[inner_ids] - 1)
+            corner_counts = np.diff(inner_offsets)
+            plane = np.repeat(plane, corner_counts)
+            distances = np.einsum("ij,ij->i", inner[:, :2], normals[plane]) + constants[plane]
+            # Past their last edge, or on a degenerate one, faces are wholly inside.
+            inside = np.logical_or(np.repeat(edge >= edge_counts[inner_ids], corner_counts), degenerate[plane])
+            distances[inside] = 1
+            outer, outer_offsets = cls._clip_to_plane(inner, inner_offsets, -distances)
+            pieces.append(cls._drop_emptied(outer, outer_offsets, inner_ids, lines))
+            inner, inner_offsets = cls._clip_to_plane(inner, inner_offsets, distances)
+            inner, inner_offsets, inner_ids = cls._drop_emptied(inner, inner_offsets, inner_ids, lines)
+
+        # What is left inside all edges is the covered part.
+        covered = np.zeros(len(sizes), dtype=sizes.dtype)
+        covered[inner_ids] = cls._face_sizes(inner, inner_offsets, lines[inner_ids])
+        covered = covered > tolerance * sizes
+        whole = np.flatnonzero(np.logical_not(covered))
+        whole_faces, whole_offsets = cls._gather_faces(faces, face_offsets, whole)
+        pieces.append((whole_faces, whole_offsets, whole))
+
+        piece_ids = np.concatenate([ids for _, _, ids in pieces])
+        piece_faces = np.concatenate([piece_faces for piece_faces, _, _ in pieces])
+        piece_offsets = np.zeros(len(piece_ids) + 1, dtype=np.intp)
+        np.cumsum(np.concatenate([np.diff(offsets) for _, offsets, _ in pieces]), out=piece_offsets[1:])
+        # Keep the faces returned whole, and the pieces of covered faces
+        # that are more than slivers.
+        piece_sizes = cls._face_sizes(piece_faces, piece_offsets, lines[piece_ids])
+        kept = np.logical_and(covered[piece_ids], piece_sizes > tolerance * sizes[piece_ids])
+        kept[len(kept) - len(whole):] = True
+        order = np.flatnonzero(kept)
+        order = order[np.argsort(piece_ids[order], kind="stable")]
+        piece_faces, piece_offsets = cls._gather_faces(piece_faces, piece_offsets, order)
+        return piece_faces, piece_offsets, piece_ids[order]
+
+    @classmethod
+    def _drop_emptied(cls, faces, face_offsets, face_ids, lines):
+        # Keeps the clipped faces that are still a polygon or segment.
+        counts = np.diff(face_offsets)
+        kept = np.flatnonzero(counts >= np.where(lines[face_ids], 2, 3))
+        faces, face_offsets = cls._gather_faces(faces, face_offsets, kept)
+        return faces, face_offsets, face_ids[kept]
+
+    @classmethod
+    def _face_sizes(cls, faces, face_offsets, lines):
+        # The unsigned area of polygons, or the length of the segments flagged in lines.
+        sizes = np.abs(cls._signed_areas(faces[:, :2], face_offsets))
+        starts = face_offsets[:-1][lines]
+        sizes[lines] = np.hypot(*(faces[starts + 1, :2] - faces[starts, :2]).T)
+        return sizes
+
+    @staticmethod
+    def _bounding_boxes(xy, face_offsets):
+        # Rows of (min x, min y, max x, max y). Every face must have at least one corner.
+        if len(face_offsets) < 2:
+            return np.zeros((0, 4), dtype=xy.dtype)
+        starts = face_offsets[:-1]
+        return np.concatenate([np.minimum.reduceat(xy, starts), np.maximum.reduceat(xy, starts)], axis=-1)
+
+    @classmethod
+    def _grid_pairs(cls, boxes, other_boxes):
+        """Returns the (i, j) index arrays of the overlapping boxes[i] and other_boxes[j].
+
+        Boxes are (min x, min y, max x, max y) rows; touching boxes do not
+        overlap. other_boxes are binned into a uniform grid with cells about
+        the size of the average box, so only boxes sharing a cell are
+        compared. Pairs are sorted by i, then j.
+        """
+        if not len(boxes) or not len(other_boxes):
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+        low = other_boxes[:, :2].min(axis=0)
+        extent = other_boxes[:, 2:].max(axis=0) - low
+        cell_size = np.maximum(extent / np.sqrt(len(other_boxes)),
+                               np.mean(other_boxes[:, 2:] - other_boxes[:, :2], axis=0))
+        cell_size = np.maximum(np.maximum(cell_size, extent / 1024), np.finfo(boxes.dtype).tiny)
+        cells = int(np.clip(np.max(np.ceil(extent / cell_size)), 1, 1024))
+
+        members, member_cells = cls._box_cells(other_boxes, low, cell_size, cells, cells)
+        order = np.argsort(member_cells, kind="stable")
+        members = members[order]
+        cell_offsets = np.searchsorted(member_cells[order], np.arange(cells * cells + 1))
+
+        i, box_cells = cls._box_cells(boxes, low, cell_size, cells, cells)
+        member_counts = cell_offsets[box_cells + 1] - cell_offsets[box_cells]
+        i = np.repeat(i, member_counts)
+        j = members[cls._ranges(cell_offsets[box_cells], member_counts)]
+        box_cells = np.repeat(box_cells, member_counts)
+        overlap = np.logical_and(np.all(boxes[i, :2] < other_boxes[j, 2:], axis=-1),
+                                 np.all(other_boxes[j, :2] < boxes[i, 2:], axis=-1))
+        i, j, box_cells = i[overlap], j[overlap], box_cells[overlap]
+
+        # Overlapping boxes share every cell of their intersection; only the
+        # cell of its lower corner reports the pair.
+        corner = np.maximum(boxes[i, :2], other_boxes[j, :2])
+        corner = np.clip(np.floor((corner - low) / cell_size), 0, cells - 1).astype(np.intp)
+        reported = box_cells == corner[:, 1] * cells + corner[:, 0]
+        i, j = i[reported], j[reported]
+        order = np.lexsort((j, i))
+        return i[order], j[order]
+
+    @classmethod
+    def _box_cells(cls, boxes, low, cell_size, columns, rows):
+        # Returns the (box, cell) index pairs of every grid cell each box
+        # touches, numbering cells row by row.
+        first = np.clip(np.floor((boxes[:, :2] - low) / cell_size), 0, [columns - 1, rows - 1]).astype(np.intp)
+        last = np.clip(np.floor((boxes[:, 2:] - low) / cell_size), 0, [columns - 1, rows - 1]).astype(np.intp)
+        spans = last - first + 1
+        counts = spans[:, 0] * spans[:, 1]
+        owners = np.repeat(np.arange(len(boxes)), counts)
+        k = cls._ranges(np.zeros(len(boxes), dtype=np.intp), counts)
+        x = first[owners, 0] + k % spans[owners, 0]
+        y = first[owners, 1] + k // spans[owners, 0]
+        return owners, y * columns + x
+
+    def _prepare_batches(self, view, mesh):
+        """Returns the _prepare results of mesh as a sequence of batches, back to front."""
+        if self.chunk_faces and mesh.num_faces > self.chunk_faces and not mesh.wireframe:
+            return self._prepare_chunks(view, mesh)
+        return [self._prepare(view, mesh)]
+
+    def _prepare_chunks(self, view, mesh):
+        """Prepares a mesh that may not fit in memory, chunk_faces faces at a time.
+
+        The arrays of mesh may be memory-mapped, e.g. from np.load(path,
+        mmap_mode="r"). Each chunk is projected and sorted on its own, then
+        appended to temporary files as a sorted run. The runs are merged by
+        depth into batches of at most chunk_faces faces, which are yielded back
+        to front, in the same order _prepare would produce.
+        """
+        projection = np.dot(view.camera.view, view.camera.projection)
+        with tempfile.TemporaryDirectory() as directory:
+            names = ("depths", "face_ids", "areas", "faces", "face_offsets")
+            spills = [_SpillFile(os.path.join(directory, name)) for name in names]
+            runs = [0]
+            corners = 0
+            for first in range(0, mesh.num_faces, self.chunk_faces):
+                chunk = self._mesh_chunk(mesh, first, min(first + self.chunk_faces, mesh.num_faces))
+                faces, _, face_offsets, face_ids, areas = self._project(projection, chunk)
+                if not len(face_ids):
                     continue
-                
-                face = np.around(face[:, :2], self.precision)
-               
-                for pt in face:
-                    group.add(drawing.circle(pt, mesh.circle_radius, **style))
-            return group
-        
-        # Create polygons and lines.
-        for face_index in num_faces_order:
-           
-            
-            face = faces[face_idxs==face_index]
-   
-            if face.shape[0] == 0:
-                continue
-            style = shader(sort_order[face_index], windings[face_index])
+                depths = self._face_depths(faces[:, 2], face_offsets)
+                for spill, array in zip(spills, (depths, face_ids + first, areas, faces,
+                                                 face_offsets[:-1] + corners)):
+                    spill.append(array)
+                runs.append(runs[-1] + len(face_ids))
+                corners += len(faces)
+            if len(runs) < 2:
+                return
+
+            # The runs share one face_offsets array, spilled without the final end.
+            spills[-1].append(np.array([corners], dtype=np.intp))
+            spilled = [spill.load() for spill in spills]
+            for batch in self._merge_runs(runs, *spilled):
+                yield self._finish(view.viewport, *batch)
+
+    @staticmethod
+    def _mesh_chunk(mesh, first, last):
+        """Returns faces first to last of mesh as an in-memory, non-indexed Mesh."""
+        start, end = int(mesh.face_offsets[first]), int(mesh.face_offsets[last])
+        face_offsets = np.asarray(mesh.face_offsets[first:last + 1]) - start
+        if mesh.indices is None:
+            faces = np.asarray(mesh.faces[start:end])
+        else:
+            faces = np.asarray(mesh.faces[np.asarray(mesh.indices[start:end])])
+        return mesh._replace(faces=faces, face_offsets=face_offsets, indices=None)
+
+    def _merge_runs(self, runs, depths, face_ids, areas, faces, face_offsets):
+        """Merges sorted runs into (faces, None, face_offsets, face_ids, areas) batches.
+
+        Run i holds faces runs[i] to runs[i + 1] of the spilled arrays, sorted
+        by decreasing depth, then increasing face id. Each step reads the next
+        few faces of every run, and emits those that no unread face can
+        precede, i.e. those up to the smallest last-read face of the runs that
+        have more faces.
+        """
+        runs = np.asarray(runs)
+        step = max(1, self.chunk_faces // (len(runs) - 1))
+        cursors, ends = runs[:-1].copy(), runs[1:]
+        while np.any(cursors < ends):
+            reads = np.minimum(cursors + step, ends)
+            window_offsets = np.concatenate([[0], np.cumsum(reads - cursors)])
+            window = self._ranges(cursors, reads - cursors)
+
+            unfinished = reads[reads < ends] - 1
+            if len(unfinished):
+                last = unfinished[np.lexsort((face_ids[unfinished], -depths[unfinished]))[0]]
+                window_depths, window_ids = -depths[window], face_ids[window]
+                before = np.logical_or(window_depths < -depths[last],
+                                       np.logical_and(window_depths == -depths[last],
+                                                      window_ids <= face_ids[last]))
+                reads = cursors + self._count_per_face(before, window_offsets)
+            selected = self._ranges(cursors, reads - cursors)
+            cursors = reads
+
+            # Read the selected faces run by run, then interleave them by depth.
+            batch_depths, batch_ids = np.asarray(depths[selected]), np.asarray(face_ids[selected])
+            order = selected[np.lexsort((batch_ids, -batch_depths))]
+            batch_faces, batch_offsets = self._gather_faces(faces, face_offsets, order)
+            yield (np.asarray(batch_faces), None, np.asarray(batch_offsets), np.asarray(face_ids[order]),
+                   np.asarray(areas[order]))
+
+    def _groups(self, view, prepared_meshes, pixel_area=None):
+        """Yields the (mesh, batches) pair of each group to emit for view.
+
+        Normally that is one group per mesh. With global_sort, the faces of
+        all meshes are ordered by depth together, ties going to the earlier
+        mesh, and every run of consecutive faces from one mesh forms a group.
+        Such a run is a contiguous slice of its mesh's own sorted faces, so
+        the groups are built from views into the prepared buffers.
+
+        With pixel_area, the output pixels per square viewport unit, small
+        polygons are merged away first; see _cull_small.
+        """
+        if pixel_area is not None:
+            prepared_meshes = [(self._cull_small(batch, pixel_area) for batch in batches)
+                               for batches in prepared_meshes]
+        if not self.global_sort:
+            yield from zip(view.scene.meshes, prepared_meshes)
+            return
+
+        prepared = [self._concatenate_batches(list(batches)) for batches in prepared_meshes]
+        if not prepared:
+            return
+        counts = [len(batch[2]) for batch in prepared]
+        mesh_ids = np.repeat(np.arange(len(prepared)), counts)
+        depths = np.concatenate([batch[4] for batch in prepared])
+        order = np.lexsort((np.arange(len(mesh_ids)), mesh_ids, -depths))
+
+        # Each run holds the faces first to first + count of its mesh, in order.
+        run_mesh_ids = mesh_ids[order]
+        run_starts = np.flatnonzero(np.diff(run_mesh_ids, prepend=-1))
+        run_counts = np.diff(np.append(run_starts, len(order)))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        run_firsts = order[run_starts] - offsets[run_mesh_ids[run_starts]]
+        for mesh_id, first, count in zip(run_mesh_ids[run_starts].tolist(), run_firsts.tolist(),
+                                         run_counts.tolist()):
+            points, face_offsets, face_ids, windings, depths = prepared[mesh_id]
+            start, end = face_offsets[first], face_offsets[first + count]
+            run = (points[start:end], face_offsets[first:first + count + 1] - start,
+                   face_ids[first:first + count], windings[first:first + count],
+                   depths[first:first + count])
+            yield view.scene.meshes[mesh_id], [run]
+
+    def _start_culling(self, drawing):
+        """Resets cull_stats for a render into drawing, returning its pixels per square unit, or None."""
+        if not self.min_face_pixels:
+            self.cull_stats = None
+            return None
+        self.cull_stats = CullStats(0, 0, 0.0)
+        return _pixels_per_unit(drawing) ** 2
+
+    def _cull_small(self, prepared, pixel_area):
+        """Merges the polygons of a _prepare result that cover less than min_face_pixels into their neighbours.
+
+        Corners are snapped to a grid of square cells of min_face_pixels
+        output pixels each. Polygons smaller than about a cell then collapse
+        and are dropped, while the neighbours sharing their corners stretch
+        over the gap. Corners move by at most half a cell, and lines and
+        points are always kept. Counts are added to cull_stats, measuring
+        culled polygons by their area before snapping.
+
+        The points are formatted here rather than in _finish, as the grid
+        depends on the drawing.
+        """
+        points, face_offsets, face_ids, windings, depths = prepared
+        cell = np.sqrt(self.min_face_pixels / pixel_area)
+        points = np.around(points.astype(np.float64, copy=False) / cell) * cell
+        # Polygons on the grid have areas in multiples of half a cell.
+        snapped = np.abs(self._signed_areas(points, face_offsets))
+        culled = np.logical_and(snapped < cell * cell / 4, np.diff(face_offsets) > 2)
+        self.cull_stats = CullStats(
+            self.cull_stats.faces + len(face_ids), self.cull_stats.culled + int(np.count_nonzero(culled)),
+            self.cull_stats.culled_pixels + float(np.abs(windings[culled]).sum() * pixel_area / 2))
+
+        kept = np.flatnonzero(np.logical_not(culled))
+        if len(kept) < len(face_ids):
+            points, face_offsets = self._gather_faces(points, face_offsets, kept)
+            face_ids, windings, depths = face_ids[kept], windings[kept], depths[kept]
+        if self.number_format != "repr":
+            points = _format_points(points, self.precision, self.number_format == "trimmed")
+        else:
+            points = np.around(points, self.precision)
+        return points, face_offsets, face_ids, windings, depths
+
+    @staticmethod
+    def _concatenate_batches(batches):
+        """Joins the _prepare results of one mesh into one."""
+        if len(batches) == 1:
+            return batches[0]
+        if not batches:
+            return [], np.zeros(1, dtype=np.intp), np.zeros(0, dtype=np.intp), np.zeros(0), np.zeros(0)
+        points, face_offsets, face_ids, windings, depths = zip(*batches)
+        if isinstance(points[0], np.ndarray):
+            points = np.concatenate(points)
+        else:
+            points = list(itertools.chain.from_iterable(points))
+        counts = np.concatenate([np.diff(offsets) for offsets in face_offsets])
+        face_offsets = np.zeros(len(counts) + 1, dtype=np.intp)
+        np.cumsum(counts, out=face_offsets[1:])
+        return (points, face_offsets, np.concatenate(face_ids), np.concatenate(windings),
+                np.concatenate(depths))
+
+    def _add_point_symbols(self, drawing, views):
+        """Adds a circle per distinct point radius to the defs of drawing, for point_format "use".
+
+        Returns a dict from radius to the IRI of its circle.
+        """
+        symbols = {}
+        if self.point_format == "use":
+            for view in views:
+                for mesh in view.scene.meshes:
+                    if mesh.circle_radius > 0 and mesh.circle_radius not in symbols:
+                        circle = drawing.defs.add(drawing.circle((0, 0), mesh.circle_radius))
+                        symbols[mesh.circle_radius] = circle.get_iri()
+        return symbols
+
+    def _create_group(self, drawing, mesh, batches, classes=None, symbol=None):
+        group = drawing.g(**(mesh.style or {}))
+        for tag, points, style in self._emit(mesh, batches, classes):
+            if tag == "polygon" and isinstance(points, str):
+                group.add(_FormattedPolygon(points, factory=drawing, **style))
+            elif tag == "polygon":
+                group.add(drawing.polygon(points, **style))
+            elif tag == "line":
+                group.add(drawing.line(points[0], points[1], **style))
+            elif tag == "path":
+                group.add(drawing.path(points, **style))
+            elif tag == "use":
+                group.add(drawing.use(symbol, insert=points, **style))
+            else:
+                group.add(drawing.circle(points, mesh.circle_radius, **style))
+        return group
+
+    def _emit(self, mesh, batches, classes=None):
+        """Yields a (tag, points, style) triple for each element of mesh, back to front.
+
+        With classes, a _StyleClasses, styles are interned into CSS classes.
+        """
+        for prepared in batches:
+            if classes is None:
+                yield from self._emit_batch(mesh, prepared)
+            else:
+                for tag, points, style in self._emit_batch(mesh, prepared):
+                    yield tag, points, classes.intern(style)
+
+    def _emit_batch(self, mesh, prepared):
+        points, face_offsets, face_ids, windings, depths = prepared
+        if mesh.batch_shader is not None:
+            if mesh.circle_radius > 0:
+                windings = np.zeros_like(windings)
+            styles = self._batch_styles(mesh, face_ids, windings, depths)
+        else:
+            shader = mesh.shader or (lambda face_index, winding: _NO_STYLE)
+            windings = itertools.repeat(0) if mesh.circle_radius > 0 else windings.tolist()
+            styles = map(shader, face_ids.tolist(), windings)
+        spans = zip(styles, face_offsets[:-1].tolist(), face_offsets[1:].tolist())
+
+        if mesh.circle_radius > 0:
+            yield from self._emit_points(mesh, points, spans)
+        elif self.merge_faces:
+            yield from self._emit_merged(mesh, points, spans, (prepared[3] > 0).tolist())
+        else:
+            yield from self._emit_faces(points, spans)
+
+    @staticmethod
+    def _emit_faces(points, spans):
+        """Emits each styled face as a polygon or, with two corners, a line."""
+        formatted = not isinstance(points, np.ndarray)
+        for style, start, end in spans:
             if style is None:
                 continue
-            
-            face = np.around(face[:, :2], self.precision)
-            
-            if len(face) == 2:
-                
-                group.add(drawing.line(face[0], face[1], **style))
+
+            face = points[start:end]
+            if end - start == 2:
+                yield "line", [pt.split(",") for pt in face] if formatted else face, style
             else:
-                
-                group.add(drawing.polygon(face, **style))
+                yield "polygon", " ".join(face) if formatted else face, style
+
+    def _emit_merged(self, mesh, points, spans, positive):
+        """Emits faces like _emit_faces, but merges runs of faces into one path each.
+
+        A face joins the run before it if it has the same style and winding
+        sign and traverses one of the run's edges the other way. The run is
+        drawn as the directed edges of its faces, less the pairs that cancel
+        out, which under the nonzero fill rule covers the same area. Styles
+        that stroke or use the even-odd rule would look different, so their
+        faces are never merged.
+
+        Runs of consecutive lines with the same style become one unfilled
+        path, whose lines are chained into as few polylines as possible.
+        """
+        if isinstance(points, np.ndarray):
+            texts = ["%s,%s" % (x, y) for x, y in points.tolist()]
+            _, first, vertex_ids = np.unique(points, axis=0, return_index=True, return_inverse=True)
+        else:
+            texts = points
+            _, first, vertex_ids = np.unique(points, return_index=True, return_inverse=True)
+        vertex_ids = vertex_ids.ravel().tolist()
+        first = first.tolist()
+        mesh_style = {key.rstrip("_").replace("_", "-"): value for key, value in (mesh.style or {}).items()}
+
+        def mergeable(style):
+            style = dict(mesh_style, **{key.rstrip("_").replace("_", "-"): value
+                                        for key, value in style.items()})
+            return style.get("stroke") in (None, "none") and style.get("fill-rule") != "evenodd"
+
+        def flush(run, run_style):
+            if len(run) == 1:
+                return self._emit_faces(points, [(run_style, run[0][0], run[0][1])])
+            loops = self._boundary_loops([vertex_ids[start:end] for start, end in run])
+            if not loops:
+                return self._emit_faces(points, [(run_style, start, end) for start, end in run])
+            path = "".join("M%sZ" % " ".join(texts[first[vertex]] for vertex in loop) for loop in loops)
+            return [("path", path, run_style)]
+
+        def flush_lines(lines, lines_style):
+            if len(lines) == 1:
+                return self._emit_faces(points, [(lines_style,) + lines[0]])
+            chains = self._chain_lines([vertex_ids[start:end] for start, end in lines])
+            path = "".join("M%s" % " ".join(texts[first[vertex]] for vertex in chain) for chain in chains)
+            return [("path", path, dict(lines_style, fill="none"))]
+
+        run, run_style, run_sign, run_edges, run_mergeable = [], None, None, set(), False
+        lines, lines_style = [], None
+        for (style, start, end), sign in zip(spans, positive):
+            if style is None:
+                continue
+            if end - start == 2:
+                if lines and style == lines_style:
+                    lines.append((start, end))
+                    continue
+                if run:
+                    yield from flush(run, run_style)
+                    run = []
+                if lines:
+                    yield from flush_lines(lines, lines_style)
+                lines, lines_style = [(start, end)], style
+                continue
+            if lines:
+                yield from flush_lines(lines, lines_style)
+                lines = []
+            corners = vertex_ids[start:end]
+            edges = list(zip(corners, corners[1:] + corners[:1]))
+            if (run and run_mergeable and sign == run_sign and style == run_style
+                    and any((b, a) in run_edges for a, b in edges)):
+                run.append((start, end))
+                run_edges.update(edges)
+                continue
+            if run:
+                yield from flush(run, run_style)
+            run, run_style, run_sign, run_edges = [(start, end)], style, sign, set(edges)
+            run_mergeable = end - start > 2 and mergeable(style)
+        if run:
+            yield from flush(run, run_style)
+        if lines:
+            yield from flush_lines(lines, lines_style)
+
+    @staticmethod
+    def _chain_lines(lines):
+        """Splits lines, given as vertex id pairs, into few vertex chains that cover each once.
+
+        Chains start at vertices with an odd number of remaining lines where
+        possible, so each connected set of lines needs few of them.
+        """
+        neighbours = collections.defaultdict(list)
+        for index, (a, b) in enumerate(lines):
+            neighbours[a].append((b, index))
+            neighbours[b].append((a, index))
+        used = [False] * len(lines)
+        starts = [vertex for vertex, adjacent in neighbours.items() if len(adjacent) % 2]
+        starts += list(neighbours)
+
+        chains = []
+        for start in starts:
+            while True:
+                chain, vertex = [start], start
+                while neighbours[vertex]:
+                    following, index = neighbours[vertex].pop()
+                    if not used[index]:
+                        used[index] = True
+                        chain.append(following)
+                        vertex = following
+                if len(chain) == 1:
+                    break
+                chains.append(chain)
+        return chains
+
+    @staticmethod
+    def _boundary_loops(faces):
+        """Returns the closed vertex loops left of faces after cancelling opposite edges.
+
+        faces holds the vertex id list of each face.
+        """
+        counts = collections.Counter()
+        for corners in faces:
+            counts.update(zip(corners, corners[1:] + corners[:1]))
+        outgoing = collections.defaultdict(list)
+        for (a, b), count in counts.items():
+            for _ in range(count - counts.get((b, a), 0)):
+                outgoing[a].append(b)
+
+        loops = []
+        for start in list(outgoing):
+            while outgoing[start]:
+                loop, vertex = [start], outgoing[start].pop()
+                while vertex != start:
+                    loop.append(vertex)
+                    vertex = outgoing[vertex].pop()
+                loops.append(loop)
+        return loops
+
+    def _emit_points(self, mesh, points, spans):
+        """Emits every corner of the faces of a point mesh, according to point_format."""
+        formatted = not isinstance(points, np.ndarray)
+        if self.point_format != "path":
+            tag = "use" if self.point_format == "use" else "circle"
+            for style, start, end in spans:
+                if style is not None:
+                    for pt in points[start:end]:
+                        yield tag, tuple(pt.split(",")) if formatted else pt, style
+            return
+
+        # Consecutive faces with equal styles share one path, which draws each
+        # point as two half circle arcs.
+        if not formatted:
+            points = ["%s,%s" % (x, y) for x, y in points.tolist()]
+        radius, diameter = mesh.circle_radius, 2 * mesh.circle_radius
+        arcs = "m-%s,0a%s,%s 0 1 0 %s,0a%s,%s 0 1 0 -%s,0" % (radius, radius, radius, diameter,
+                                                           radius, radius, diameter)
+        for style, run in itertools.groupby(spans, key=lambda span: span[0]):
+            if style is not None:
+                run = list(run)
+                yield "path", "M" + (arcs + "M").join(points[run[0][1]:run[-1][2]]) + arcs, style
+
+    def _batch_styles(self, mesh, face_ids, windings, depths):
+        """Calls the batch shader of mesh once for the given faces and returns a style per face.
+
+        The shader is called as batch_shader(face_ids, windings, depths,
+        normals) with one array entry per face: its index in mesh, its winding,
+        its depth sort key and its unit normal in model space, by Newell's
+        method. It returns either a sequence of style dicts, or a (palette,
+        palette_ids) pair where palette is a sequence of style dicts and
+        palette_ids holds an index into it per face. A None style or negative
+        palette index skips the face. Palette styles are shared by all their
+        faces, so the writer formats each of them once.
+        """
+        if mesh.wireframe:
+            normals = np.zeros((len(face_ids), 3), dtype=depths.dtype)
+        else:
+            normals = self._face_normals(mesh, face_ids)
+        result = mesh.batch_shader(face_ids, windings, depths, normals)
+        if not isinstance(result, tuple):
+            return result
+        palette, palette_ids = result
+        palette = list(palette) + [None]  # negative ids pick the final None
+        return [palette[i] for i in np.maximum(palette_ids, -1).tolist()]
+
+    @staticmethod
+    def _face_normals(mesh, face_ids):
+        """Returns the unit normal of each given face of mesh by Newell's method.
+
+        Faces with no area, like lines, get a zero normal.
+        """
+        corners = mesh.faces if mesh.indices is None else mesh.indices
+        corners, face_offsets = Engine._gather_faces(corners, mesh.face_offsets, face_ids)
+        if mesh.indices is not None:
+            corners = mesh.faces[corners]
+        corners = np.asarray(corners)
+        if not len(face_ids):
+            return np.zeros((0, 3), dtype=corners.dtype)
+        following = np.arange(1, len(corners) + 1)
+        following[face_offsets[1:] - 1] = face_offsets[:-1]
+        current, after = corners, corners[following]
+        terms = np.stack([(current[:, 1] - after[:, 1]) * (current[:, 2] + after[:, 2]),
+                          (current[:, 2] - after[:, 2]) * (current[:, 0] + after[:, 0]),
+                          (current[:, 0] - after[:, 0]) * (current[:, 1] + after[:, 1])], axis=-1)
+        normals = np.add.reduceat(terms, face_offsets[:-1])
+        lengths = np.linalg.norm(normals, axis=-1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(lengths > 0, normals / lengths, 0)
+
+    @staticmethod
+    def _count_per_face(flags, face_offsets):
+        # Segmented sum via a running total, so empty faces need no special case.
+        totals = np.concatenate([[0], np.cumsum(flags)])
+        return totals[face_offsets[1:]] - totals[face_offsets[:-1]]
+
+    @classmethod
+    def _clip_to_frustum(cls, faces, face_offsets):
+        """Clips clip-space faces against the six frustum planes, Sutherland-Hodgman style.
+
+        All faces are clipped against one plane at a time. Two-corner faces
+        are clipped as open segments. Returns (faces, face_offsets, face_ids)
+        for the faces that keep at least one corner.
+        """
+        face_ids = np.flatnonzero(np.diff(face_offsets) > 0)
+        faces, face_offsets = cls._gather_faces(faces, face_offsets, face_ids)
+        # The near plane goes first, which leaves w > 0 for the others.
+        for axis, sign in ((2, 1), (2, -1), (0, 1), (0, -1), (1, 1), (1, -1)):
+            distances = faces[:, 3] + sign * faces[:, axis]
+            faces, face_offsets = cls._clip_to_plane(faces, face_offsets, distances)
+            kept = np.flatnonzero(np.diff(face_offsets) > 0)
+            if len(kept) < len(face_ids):
+                # Emptied faces own no corners, so only the offsets need compacting.
+                face_ids = face_ids[kept]
+                face_offsets = np.concatenate([[0], face_offsets[1:][kept]])
+        return faces, face_offsets, face_ids
+
+    @staticmethod
+    def _clip_to_plane(faces, face_offsets, distances):
+        # Corners with a non-negative distance are inside. Every face must
+        # have at least one corner.
+        following = np.arange(1, len(faces) + 1)
+        following[face_offsets[1:] - 1] = face_offsets[:-1]
+        inside = distances >= 0
+
+        # Each corner emits itself if inside, then the crossing point of its
+        # outgoing edge. Two-corner faces have no closing edge.
+        has_edge = np.ones(len(faces), dtype=bool)
+        counts = np.diff(face_offsets)
+        has_edge[face_offsets[1:][counts == 2] - 1] = False
+        crossing = np.logical_and(has_edge, inside != inside[following])
+
+        emitted = np.zeros(len(faces) + 1, dtype=np.intp)
+        np.cumsum(inside.astype(np.intp) + crossing, out=emitted[1:])
+        clipped = np.empty((emitted[-1], faces.shape[1]), dtype=faces.dtype)
+        clipped[emitted[:-1][inside]] = faces[inside]
+
+        start, end = np.flatnonzero(crossing), following[crossing]
+        t = distances[start] / (distances[start] - distances[end])
+        crossings = faces[start] + t[:, np.newaxis] * (faces[end] - faces[start])
+        clipped[emitted[:-1][crossing] + inside[crossing]] = crossings
+        return clipped, emitted[face_offsets]
+
+    @classmethod
+    def _fan_triangles(cls, face_offsets):
+        """Returns the (num_triangles, 3) corner indices of each triangle of a fan triangulation, and its face.
+
+        Triangle k of a face joins its corners 0, k + 1 and k + 2. Faces with
+        fewer than three corners have no triangles.
+        """
+        counts = np.maximum(np.diff(face_offsets) - 2, 0)
+        face_of_triangle = np.repeat(np.arange(len(counts)), counts)
+        k = cls._ranges(np.zeros(len(counts), dtype=np.intp), counts)
+        first = face_offsets[:-1][face_of_triangle]
+        return np.stack([first, first + k + 1, first + k + 2], axis=-1), face_of_triangle
+
+    @classmethod
+    def _triangulate(cls, xy, face_offsets):
+        """Returns the (num_triangles, 3) corner indices of each triangle of every face, and its face.
+
+        Faces without a reflex corner are fan-triangulated. The others are
+        ear-clipped, all at once: each round cuts one ear, a convex corner
+        whose triangle holds no other remaining corner, off every such face.
+        Triangles keep the winding of their face and are grouped by face.
+        Faces must not intersect themselves; those with fewer than three
+        corners have no triangles.
+        """
+        counts = np.diff(face_offsets)
+        following = np.arange(1, len(xy) + 1)
+        following[face_offsets[1:] - 1] = face_offsets[:-1]
+        preceding = np.empty_like(following)
+        preceding[following] = np.arange(len(xy))
+        orientation = np.repeat(np.sign(cls._signed_areas(xy, face_offsets)), counts)
+
+        def turns(corners):
+            incoming = xy[corners] - xy[preceding[corners]]
+            outgoing = xy[following[corners]] - xy[corners]
+            return (incoming[:, 0] * outgoing[:, 1] - incoming[:, 1] * outgoing[:, 0]) * orientation[corners]
+
+        reflex = cls._count_per_face(turns(np.arange(len(xy))) < 0, face_offsets) > 0
+        concave = np.flatnonzero(np.logical_and(reflex, counts > 3))
+        convex = np.ones(len(counts), dtype=bool)
+        convex[concave] = False
+        triangles, triangle_faces = cls._fan_triangles(face_offsets)
+        fanned = convex[triangle_faces]
+        triangles, triangle_faces = [triangles[fanned]], [triangle_faces[fanned]]
+
+        # Remaining corners of the concave faces, linked through preceding and following.
+        alive = np.zeros(len(xy), dtype=bool)
+        alive[cls._ranges(face_offsets[concave], counts[concave])] = True
+        left = counts.copy()
+        while len(concave):
+            corners = np.flatnonzero(alive)
+            faces = np.repeat(concave, left[concave])
+            starts = np.concatenate([[0], np.cumsum(left[concave])[:-1]])
+            first = np.repeat(starts, left[concave])
+            sizes = left[faces]
+
+            # Pair each corner with every remaining corner of its face, and
+            # look for those inside or on its triangle.
+            tips = np.repeat(np.arange(len(corners)), sizes)
+            others = corners[cls._ranges(first, sizes)]
+            tips = corners[tips]
+            a, b, c, p = xy[preceding[tips]], xy[tips], xy[following[tips]], xy[others]
+            sign = orientation[tips]
+            inside = np.ones(len(tips), dtype=bool)
+            for start, end in ((a, b), (b, c), (c, a)):
+                edge, offset = end - start, p - start
+                inside &= (edge[:, 0] * offset[:, 1] - edge[:, 1] * offset[:, 0]) * sign >= 0
+            own = np.logical_or(np.logical_or(others == tips, others == preceding[tips]), others == following[tips])
+            blocked = np.zeros(len(xy), dtype=bool)
+            blocked[tips[np.logical_and(inside, np.logical_not(own))]] = True
+            ears = np.logical_and(turns(corners) > 0, np.logical_not(blocked[corners]))
+
+            # Cut the first ear of each face, or its first corner if rounding
+            # left it without one.
+            rank = np.where(ears, 0, len(corners)) + np.arange(len(corners))
+            cut = corners[np.minimum.reduceat(rank, starts) % len(corners)]
+            triangles.append(np.stack([preceding[cut], cut, following[cut]], axis=-1))
+            triangle_faces.append(concave)
+            alive[cut] = False
+            following[preceding[cut]] = following[cut]
+            preceding[following[cut]] = preceding[cut]
+            left[concave] -= 1
+
+            # The last triangle of a face is what remains of it.
+            last = left[concave] == 3
+            finished = concave[last]
+            if len(finished):
+                third = corners[np.minimum.reduceat(np.where(alive[corners], np.arange(len(corners)), len(corners)),
+                                                    starts)[last]]
+                triangles.append(np.stack([preceding[third], third, following[third]], axis=-1))
+                triangle_faces.append(finished)
+                alive[cls._ranges(face_offsets[finished], counts[finished])] = False
+            concave = concave[np.logical_not(last)]
+
+        triangles, triangle_faces = np.concatenate(triangles), np.concatenate(triangle_faces)
+        order = np.argsort(triangle_faces, kind="stable")
+        return triangles[order], triangle_faces[order]
+
+    @staticmethod
+    def _signed_areas(xy, face_offsets):
+        """Returns twice the signed area of each face by the shoelace formula.
+
+        Every face must have at least one corner.
+        """
+        if len(face_offsets) < 2:
+            return np.zeros(0, dtype=xy.dtype)
+        following = np.arange(1, len(xy) + 1)
+        following[face_offsets[1:] - 1] = face_offsets[:-1]  # the last corner wraps around
+        cross = xy[:, 0] * xy[following, 1] - xy[following, 0] * xy[:, 1]
+        return np.add.reduceat(cross, face_offsets[:-1])
+
+    @staticmethod
+    def _gather_faces(faces, face_offsets, face_ids):
+        """Copies the given faces, in the given order, into a new contiguous buffer."""
+        starts = face_offsets[face_ids]
+        counts = face_offsets[face_ids + 1] - starts
+        new_offsets = np.zeros(len(face_ids) + 1, dtype=np.intp)
+        np.cumsum(counts, out=new_offsets[1:])
+        corners = np.arange(new_offsets[-1]) + np.repeat(starts - new_offsets[:-1], counts)
+        return faces[corners], new_offsets
+
+    @staticmethod
+    def _ranges(starts, counts):
+        # Concatenates arange(start, start + count) for each start and count.
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        return np.arange(offsets[-1]) + np.repeat(starts - offsets[:-1], counts)
+
+    def _sort_back_to_front(self, z, face_offsets):
+        """Returns the face order that draws the farthest faces first.
+
+        z holds the depth of each corner. Every face must have at least one corner.
+        """
+        if len(face_offsets) < 2:
+            return np.zeros(0, dtype=np.intp)
+
+        # Farthest faces first; ties keep their original face order.
+        return np.argsort(-self._face_depths(z, face_offsets), kind="stable")
+
+    def _face_depths(self, z, face_offsets):
+        """Reduces the corner depths z of each face to a single key, according to sort_by."""
+        if len(face_offsets) < 2:
+            return np.zeros(0, dtype=z.dtype)
+        starts = face_offsets[:-1]
+
+        if self.sort_by == "mean":
+            depths = np.add.reduceat(z, starts) / np.diff(face_offsets).astype(z.dtype)
+        elif self.sort_by == "max":
+            depths = np.maximum.reduceat(z, starts)
+        else:
+            depths = np.minimum.reduceat(z, starts)
+        return depths
+
+
+def load_mesh(path, dtype=np.float64, **kwargs):
+    """Loads an OBJ, PLY, STL or NPZ file as a Mesh, choosing the reader by extension.
+
+    Extra keyword arguments, such as shader or style, are passed to Mesh.
+    """
+    loaders = {".obj": load_obj, ".ply": load_ply, ".stl": load_stl, ".npz": load_npz}
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in loaders:
+        raise ValueError("unsupported mesh format %r" % (extension,))
+    return loaders[extension](path, dtype=dtype, **kwargs)
+
+
+def load_obj(path, dtype=np.float64, **kwargs):
+    """Loads the vertices and faces of a Wavefront OBJ file as an indexed Mesh.
+
+    Texture coordinates, normals, groups and materials are ignored. Faces may
+    have any number of corners. Lines are classified and the numbers parsed
+    over the whole file at once, without a Python loop per line.
+    """
+    with open(path, "rb") as f:
+        text = np.frombuffer(f.read() + b"\n", dtype=np.uint8)
+
+    # Drop comments, from a "#" to the end of its line, and the blanks that
+    # indent a line. Files without either skip these passes.
+    hashes = text == ord("#")
+    if np.any(hashes):
+        position = np.arange(len(text), dtype=np.intp)
+        newline = text == ord("\n")
+        last_newline = np.maximum.accumulate(np.where(newline, position, -1))
+        last_hash = np.maximum.accumulate(np.where(hashes, position, -1))
+        text = text[np.logical_or(last_hash < last_newline, newline)]
+    starts = np.concatenate([[0], np.flatnonzero(text[:-1] == ord("\n")) + 1])
+    if np.any(np.isin(text[starts], np.frombuffer(b" \t\r", dtype=np.uint8))):
+        position = np.arange(len(text), dtype=np.intp)
+        blank = np.isin(text, np.frombuffer(b" \t\r", dtype=np.uint8))
+        last_newline = np.maximum.accumulate(np.where(text == ord("\n"), position, -1))
+        last_mark = np.maximum.accumulate(np.where(blank, -1, position))
+        text = text[np.logical_not(np.logical_and(blank, last_mark == last_newline))]
+
+    # Classify every line by its first two bytes, then spread that to its bytes.
+    ends = np.flatnonzero(text == ord("\n"))
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    second = text[np.minimum(starts + 1, len(text) - 1)]
+    blank = np.logical_or(second == ord(" "), second == ord("\t"))
+    is_vertex = np.logical_and(text[starts] == ord("v"), blank)
+    is_face = np.logical_and(text[starts] == ord("f"), blank)
+    kind = np.repeat(is_vertex.astype(np.uint8) + 2 * is_face.astype(np.uint8), ends - starts + 1)
+
+    # Parse all vertices with one conversion; extra columns (w, colors) are dropped.
+    vertex_text = text[kind == 1]
+    vertex_text = np.where(vertex_text == ord("v"), np.uint8(ord(" ")), vertex_text).tobytes()
+    vertices = np.fromstring(vertex_text, dtype=dtype, sep=" ")
+    if len(vertices) == 3 * is_vertex.sum():
+        vertices = vertices.reshape(-1, 3)
+    else:
+        vertices = np.array([line.split()[:3] for line in vertex_text.decode().splitlines()],
+                            dtype=dtype).reshape(-1, 3)
+
+    # Keep only the vertex index of each v/vt/vn corner: drop every byte that
+    # follows a slash within the same token.
+    face_text = text[kind == 2]
+    space = _is_space(face_text)
+    position = np.arange(len(face_text), dtype=np.int32)
+    last_space = np.maximum.accumulate(np.where(space, position, -1))
+    last_slash = np.maximum.accumulate(np.where(face_text == ord("/"), position, -1))
+    face_text = face_text[np.logical_or(last_slash < last_space, space)]
+    face_text = np.where(face_text == ord("f"), np.uint8(ord(" ")), face_text)
+
+    # Count the corners of each face from the token starts between its newlines.
+    space = _is_space(face_text)
+    token_starts = np.flatnonzero(np.logical_and(space[:-1], np.logical_not(space[1:]))) + 1
+    line_ends = np.flatnonzero(face_text == ord("\n"))
+    counts = np.diff(np.searchsorted(token_starts, line_ends), prepend=0).astype(np.intp)
+    indices = np.fromstring(face_text.tobytes(), dtype=np.intp, sep=" ")
+    if np.any(indices < 0):
+        # Negative indices count back from the last vertex defined before the face.
+        defined = np.repeat(np.cumsum(is_vertex)[is_face], counts)
+        indices = np.where(indices < 0, indices + defined + 1, indices)
+    indices -= 1
+
+    face_offsets = np.zeros(len(counts) + 1, dtype=np.intp)
+    np.cumsum(counts, out=face_offsets[1:])
+    return Mesh(vertices, face_offsets, indices=indices, **kwargs)
+
+
+def _is_space(text):
+    return np.isin(text, np.frombuffer(b" \t\r\n", dtype=np.uint8))
+
+
+_PLY_TYPES = {
+    "char": "i1", "int8": "i1", "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2", "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4", "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4", "double": "f8", "float64": "f8",
+}
+
+
+def load_ply(path, dtype=np.float64, **kwargs):
+    """Loads the vertex and face elements of a binary PLY file as an indexed Mesh.
+
+    The file is memory-mapped. Faces that all have the same number of corners
+    are read with a single structured view; otherwise one pass over the
+    corner counts locates the faces, whose indices are then read at once.
+    """
+    with open(path, "rb") as f:
+        header = []
+        while not header or header[-1] != "end_header":
+            line = f.readline()
+            if not line:
+                raise ValueError("%s: PLY header has no end_header" % path)
+            header.append(line.decode("ascii").strip())
+        offset = f.tell()
+    if header[0] != "ply":
+        raise ValueError("%s is not a PLY file" % path)
+
+    endian = None
+    elements = []  # (name, count, [(property, type or (count type, item type))])
+    for line in header[1:]:
+        words = line.split()
+        if words[0] == "format":
+            if words[1] not in ("binary_little_endian", "binary_big_endian"):
+                raise ValueError("%s: only binary PLY files are supported, not %s" % (path, words[1]))
+            endian = "<" if words[1] == "binary_little_endian" else ">"
+        elif words[0] == "element":
+            elements.append((words[1], int(words[2]), []))
+        elif words[0] == "property" and words[1] == "list":
+            elements[-1][2].append((words[4], (_PLY_TYPES[words[2]], _PLY_TYPES[words[3]])))
+        elif words[0] == "property":
+            elements[-1][2].append((words[2], _PLY_TYPES[words[1]]))
+
+    data = np.memmap(path, dtype=np.uint8, mode="r", offset=offset)
+    position = 0
+    columns = {}
+    for name, count, properties in elements:
+        columns[name], size = _read_ply_element(data, position, count, properties, endian)
+        position += size
+
+    vertex = columns["vertex"]
+    vertices = np.empty((len(vertex["x"]), 3), dtype=dtype)
+    for axis, prop in enumerate("xyz"):
+        vertices[:, axis] = vertex[prop]
+
+    face = columns.get("face", {"vertex_indices": np.zeros((0, 3), dtype=np.intp)})
+    lists = face["vertex_indices"] if "vertex_indices" in face else face["vertex_index"]
+    if isinstance(lists, np.ndarray):
+        counts = np.full(len(lists), lists.shape[1], dtype=np.intp)
+        indices = lists.reshape(-1).astype(np.intp)
+    else:
+        indices, counts = lists
+        indices = indices.astype(np.intp)
+    face_offsets = np.zeros(len(counts) + 1, dtype=np.intp)
+    np.cumsum(counts, out=face_offsets[1:])
+    return Mesh(vertices, face_offsets, indices=indices, **kwargs)
+
+
+def _read_ply_element(data, position, count, properties, endian):
+    """Returns ({property: values}, size in bytes) of the PLY element starting at position.
+
+    List properties come back as a 2-D array when every record holds the same
+    number of items, which is then read as one structured view, and otherwise
+    as a (values, counts) pair of all items in order and the items per record.
+    """
+    fields = []
+    for prop, kind in properties:
+        if isinstance(kind, tuple):
+            # Guess that every record has as many items as the first one.
+            count_type = np.dtype(endian + kind[0])
+            start = position + np.dtype(fields).itemsize
+            items = int(data[start:start + count_type.itemsize].view(count_type)[0]) if count else 0
+            fields.append((prop + "_count", count_type))
+            fields.append((prop, endian + kind[1], (items,)))
+        else:
+            fields.append((prop, endian + kind))
+    record = np.dtype(fields)
+
+    size = count * record.itemsize
+    if position + size <= len(data):
+        array = data[position:position + size].view(record)
+        # If every count matches the guess, each record really starts where the view says.
+        if all(np.all(array[prop + "_count"] == record[prop].shape[0])
+               for prop, kind in properties if isinstance(kind, tuple)):
+            return {prop: array[prop] for prop, _ in properties}, size
+
+    # Otherwise the records are walked by their list counts alone, noting
+    # where every property starts; the values are then gathered at once.
+    # The walk takes one cheap Python step per record: where the next record
+    # starts depends on the count in this one, and pointer doubling over
+    # every byte of the element, the vectorized alternative, measured
+    # several times slower.
+    layout = []  # (size before any items, item size, count unpacker or None)
+    for prop, kind in properties:
+        if isinstance(kind, tuple):
+            count_type, item_type = np.dtype(endian + kind[0]), np.dtype(endian + kind[1])
+            layout.append((count_type.itemsize, item_type.itemsize, struct.Struct(endian + count_type.char).unpack_from))
+        else:
+            layout.append((np.dtype(kind).itemsize, 0, None))
+    buffer = memoryview(data)
+    starts = [[] for _ in properties]
+    end = position
+    if len(layout) == 1 and layout[0][2] is not None:
+        # The usual face element: a single list per record, mostly with uchar counts.
+        size, item_size, unpack = layout[0]
+        append = starts[0].append
+        if properties[0][1][0] == "u1":
+            for _ in range(count):
+                append(end)
+                end += size + item_size * buffer[end]
+        else:
+            for _ in range(count):
+                append(end)
+                end += size + item_size * unpack(buffer, end)[0]
+    else:
+        for _ in range(count):
+            for prop_starts, (size, item_size, unpack) in zip(starts, layout):
+                prop_starts.append(end)
+                end += size if unpack is None else size + item_size * unpack(buffer, end)[0]
+
+    columns = {}
+    for (prop, kind), prop_starts in zip(properties, starts):
+        prop_starts = np.array(prop_starts, dtype=np.intp)
+        if not isinstance(kind, tuple):
+            columns[prop] = _gather_ply_values(data, prop_starts, np.dtype(endian + kind))
+            continue
+        count_type, item_type = np.dtype(endian + kind[0]), np.dtype(endian + kind[1])
+        counts = _gather_ply_values(data, prop_starts, count_type).astype(np.intp)
+        item_starts = Engine._ranges(np.zeros(len(counts), dtype=np.intp), counts) * item_type.itemsize
+        item_starts += np.repeat(prop_starts + count_type.itemsize, counts)
+        columns[prop] = _gather_ply_values(data, item_starts, item_type), counts
+    return columns, end - position
+
+
+def _gather_ply_values(data, starts, dtype):
+    """Reads a value of dtype at each byte position in starts of data, without copying data.
+
+    Positions are grouped by their remainder modulo the item size, so each
+    group is an index into one aligned view of data.
+    """
+    values = np.empty(len(starts), dtype=dtype)
+    remainders = starts % dtype.itemsize
+    for remainder in np.flatnonzero(np.bincount(remainders, minlength=dtype.itemsize)).tolist():
+        selected = remainders == remainder
+        length = (len(data) - remainder) // dtype.itemsize * dtype.itemsize
+        view = data[remainder:remainder + length].view(dtype)
+        values[selected] = view[(starts[selected] - remainder) // dtype.itemsize]
+    return values
+
+
+_STL_RECORD = np.dtype([("normal", "<f4", (3,)), ("corners", "<f4", (3, 3)), ("attribute", "<u2")])
+
+
+def load_stl(path, dtype=np.float64, **kwargs):
+    """Loads a binary STL file as a triangle Mesh, reading the triangles through a memory map."""
+    with open(path, "rb") as f:
+        f.seek(80)
+        count = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+    if os.path.getsize(path) != 84 + count * _STL_RECORD.itemsize:
+        raise ValueError("%s is not a binary STL file" % path)
+    if count:
+        records = np.memmap(path, dtype=_STL_RECORD, mode="r", offset=84, shape=(count,))
+        faces = np.array(records["corners"], dtype=dtype).reshape(-1, 3)
+    else:
+        faces = np.zeros((0, 3), dtype=dtype)
+    face_offsets = np.arange(0, 3 * count + 1, 3, dtype=np.intp)
+    return Mesh(faces, face_offsets, **kwargs)
+
+
+def load_npz(path, dtype=np.float64, **kwargs):
+    """Loads a mesh written by save_npz."""
+    with np.load(path) as data:
+        faces = data["faces"].astype(dtype)
+        face_offsets = data["face_offsets"].astype(np.intp)
+        indices = data["indices"].astype(np.intp) if "indices" in data.files else None
+    return Mesh(faces, face_offsets, indices=indices, **kwargs)
 
-        return group
 
-    def _sort_back_to_front(self, faces, face_idxs, num_faces):
-        
-        
-        z_centroids = [-np.mean(faces[face_idxs==i,2]) for i in range(num_faces)]
-        sort_order = np.concatenate([np.argwhere(face_idxs==i) for i in np.argsort(z_centroids)])
-        
-        return np.squeeze(sort_order, axis=1)
+def save_npz(path, mesh):
+    """Saves the geometry of mesh, indexed or not, for load_npz."""
+    arrays = dict(faces=mesh.faces, face_offsets=mesh.face_offsets)
+    if mesh.indices is not None:
+        arrays["indices"] = mesh.indices
+    np.savez(path, **arrays)
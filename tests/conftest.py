@@ -0,0 +1,6 @@
+import os
+import sys
+
+# svg.py lives at the top of the repository, next to Blender add-on modules
+# that cannot be imported outside Blender, so it is put on the path directly.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,42 @@
+import io
+import re
+
+import numpy as np
+import pyrr
+import pytest
+
+import svg
+
+
+def _views():
+    rng = np.random.default_rng(0)
+    view = pyrr.matrix44.create_look_at(eye=[0, 0, -4], target=[0, 0, 0], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=40, aspect=1, near=1, far=8)
+    camera = svg.Camera(view, projection)
+    large = svg.Mesh(rng.uniform(-1, 1, (3000, 3)), np.arange(0, 3001, 3), style=dict(fill="red"))
+    small = svg.Mesh(rng.uniform(-1, 1, (300, 3)), np.arange(0, 301, 3))
+    return [svg.View(camera, svg.Scene([large, small])), svg.View(camera, svg.Scene([small, large]))]
+
+
+def _render(views, **options):
+    output = io.StringIO()
+    svg.Engine(views, **options).render_stream(output)
+    # svgwrite numbers clip paths with a process-wide counter.
+    return re.sub(r"id\d+", "id", output.getvalue())
+
+
+def test_chunked_meshes_stay_out_of_workers():
+    views = _views()
+    engine = svg.Engine(views, chunk_faces=100, processes=2)
+
+    sent = [[mesh.num_faces for mesh in view.scene.meshes] for view in engine._shaderless_views()]
+
+    assert sent == [[0, 100], [100, 0]]
+    expected = _render(views)
+    assert _render(views, chunk_faces=100) == expected
+    assert _render(views, chunk_faces=100, processes=2) == expected
+
+
+def test_chunking_warns_with_whole_mesh_options():
+    with pytest.warns(UserWarning, match="chunk_faces"):
+        svg.Engine(_views(), chunk_faces=100, global_sort=True)
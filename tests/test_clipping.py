@@ -0,0 +1,40 @@
+import numpy as np
+import pyrr
+
+import svg
+
+
+def _view(mesh):
+    view = pyrr.matrix44.create_look_at(eye=[0, 1, 0], target=[0, 1, 10], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=60, aspect=1, near=0.5, far=100)
+    return svg.View(svg.Camera(view, projection), svg.Scene([mesh]))
+
+
+def test_ground_plane_is_clipped_to_the_viewport():
+    ground = svg.Mesh(np.array([[-50, 0, -50], [50, 0, -50], [50, 0, 50], [-50, 0, 50]], dtype=float),
+                      np.array([0, 4]))
+    view = _view(ground)
+
+    rejected = svg.Engine([view])._prepare(view, ground)
+    points, face_offsets, face_ids, _, _ = svg.Engine([view], frustum_clip=True)._prepare(view, ground)
+
+    assert len(rejected[2]) == 0
+    assert list(face_ids) == [0] and len(face_offsets) == 2
+    assert face_offsets[1] >= 3
+    assert np.all(points >= -0.5 - 1e-9) and np.all(points <= 0.5 + 1e-9)
+    # The plane fills the viewport from its bottom edge up to the horizon,
+    # just below the middle as the far plane cuts it off.
+    np.testing.assert_allclose([points[:, 0].min(), points[:, 0].max(), points[:, 1].max()], [-0.5, 0.5, 0.5])
+    assert 0 < points[:, 1].min() < 0.1
+
+
+def test_lines_are_clipped_at_the_viewport_edge():
+    # From straight ahead to far off to the right, at a constant depth.
+    line = svg.Mesh(np.array([[0, 1, 10], [40, 1, 10]], dtype=float), np.array([0, 2]))
+    view = _view(line)
+
+    points, face_offsets, face_ids, _, _ = svg.Engine([view], frustum_clip=True)._prepare(view, line)
+
+    assert list(face_ids) == [0] and list(face_offsets) == [0, 2]
+    np.testing.assert_allclose(points[0], [0, 0], atol=1e-9)
+    np.testing.assert_allclose(np.abs(points[1]), [0.5, 0], atol=1e-9)
@@ -0,0 +1,127 @@
+import io
+
+import numpy as np
+import pyrr
+import pytest
+import svgwrite
+
+import svg
+
+
+def _views(num_meshes, seed):
+    rng = np.random.default_rng(seed)
+    view = pyrr.matrix44.create_look_at(eye=[0, 0, -4], target=[0, 0, 0], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=40, aspect=1, near=1, far=8)
+    meshes = [svg.Mesh(rng.uniform(-1, 1, (900, 3)), np.arange(0, 901, 3)) for _ in range(num_meshes)]
+    return [svg.View(svg.Camera(view, projection), svg.Scene(meshes))]
+
+
+def _drawn_faces(engine):
+    # (mesh index, face id) of every emitted face, in drawing order.
+    drawn = []
+    for prepared_meshes in engine._prepare_views():
+        view = engine.views[0]
+        for mesh, batches in engine._groups(view, prepared_meshes):
+            mesh_index = next(i for i, other in enumerate(view.scene.meshes) if other is mesh)
+            drawn += [(mesh_index, face_id) for batch in batches for face_id in batch[2].tolist()]
+    return drawn
+
+
+@pytest.mark.parametrize("num_meshes", [1, 3])
+def test_fragments_keep_global_depth_order(num_meshes):
+    views = _views(num_meshes, seed=num_meshes)
+    painted = _drawn_faces(svg.Engine(views, global_sort=True))
+    ranks = {face: rank for rank, face in enumerate(painted)}
+
+    drawn = _drawn_faces(svg.Engine(views, global_sort=True, hidden_surface_removal=True))
+
+    assert 0 < len(set(drawn)) < len(painted)
+    assert all(ranks[a] <= ranks[b] for a, b in zip(drawn, drawn[1:]))
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_global_sort_renders(stream, tmp_path):
+    engine = svg.Engine(_views(1, seed=0), global_sort=True, hidden_surface_removal=True)
+    if stream:
+        output = io.StringIO()
+        engine.render_stream(output)
+        assert output.getvalue().count("<polygon") > 0
+    else:
+        drawing = svgwrite.Drawing(str(tmp_path / "out.svg"))
+        engine.return_coords(drawing)
+        assert drawing.tostring().count("<polygon") > 0
+
+
+def _star_polygons(rng, count):
+    # Simple polygons of four to six corners, star-shaped around their
+    # center, most of them concave.
+    polygons = []
+    while len(polygons) < count:
+        angles = np.sort(rng.uniform(0, 2 * np.pi, rng.integers(4, 7)))
+        if np.max(np.diff(np.append(angles, angles[0] + 2 * np.pi))) >= np.pi:
+            continue
+        radii = rng.uniform(0.1, 0.5, len(angles))
+        center = rng.uniform(-0.6, 0.6, 2)
+        xy = center + np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=-1)
+        z = np.full((len(angles), 1), rng.uniform(-0.9, 0.9))
+        polygons.append(np.concatenate([xy, z], axis=-1)[::rng.choice([-1, 1])])
+    return polygons
+
+
+def _emitted_polygons(engine):
+    # (face id, viewport corners) of every emitted polygon, in drawing order.
+    polygons = []
+    for prepared_meshes in engine._prepare_views():
+        for _, batches in engine._groups(engine.views[0], prepared_meshes):
+            for points, face_offsets, face_ids, _, _ in batches:
+                for face_id, first, last in zip(face_ids.tolist(), face_offsets[:-1], face_offsets[1:]):
+                    polygons.append((face_id, points[first:last]))
+    return polygons
+
+
+def _inside(polygon, samples):
+    # Even-odd rule.
+    x, y = samples[:, 0:1], samples[:, 1:2]
+    x0, y0 = polygon[:, 0], polygon[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = np.logical_and((y0 > y) != (y1 > y), x < x0 + (y - y0) * (x1 - x0) / (y1 - y0))
+    return np.count_nonzero(crossing, axis=1) % 2 == 1
+
+
+def test_concave_occluders():
+    rng = np.random.default_rng(7)
+    polygons = _star_polygons(rng, 60)
+    mesh = svg.Mesh(np.concatenate(polygons), np.concatenate([[0], np.cumsum([len(p) for p in polygons])]))
+    views = [svg.View(svg.Camera(np.eye(4), np.eye(4)), svg.Scene([mesh]))]
+    samples = rng.uniform(-0.5, 0.5, (3000, 2))
+
+    painted = np.full(len(samples), -1)
+    for face_id, corners in _emitted_polygons(svg.Engine(views)):
+        painted[_inside(corners, samples)] = face_id
+    covering = np.zeros(len(samples), dtype=int)
+    visible = np.full(len(samples), -1)
+    for face_id, corners in _emitted_polygons(svg.Engine(views, hidden_surface_removal=True)):
+        inside = _inside(corners, samples)
+        covering += inside
+        visible[inside] = face_id
+
+    assert np.count_nonzero(painted >= 0) > 1000
+    assert covering.max() == 1
+    np.testing.assert_array_equal(visible, painted)
+
+
+@pytest.mark.parametrize("roll", range(4))
+def test_triangle_seen_through_the_notch_of_a_dart(roll):
+    triangle = [(-0.2, -0.7, 0.5), (0.2, -0.7, 0.5), (0, -0.3, 0.5)]
+    dart = [(-0.8, -0.8, 0.1), (0, 0.2, 0.1), (0.8, -0.8, 0.1), (0, 0.8, 0.1)]
+    dart = dart[roll:] + dart[:roll]
+    mesh = svg.Mesh(np.array(triangle + dart), np.array([0, 3, 7]))
+    views = [svg.View(svg.Camera(np.eye(4), np.eye(4)), svg.Scene([mesh]))]
+
+    areas = np.zeros(2)
+    for face_id, corners in _emitted_polygons(svg.Engine(views, hidden_surface_removal=True)):
+        areas[face_id] += abs(svg.Engine._signed_areas(corners, np.array([0, len(corners)]))[0]) / 2
+
+    # In viewport units, half the size of normalized device coordinates.
+    np.testing.assert_allclose(areas, [0.08 / 4, 0.48 / 4])
@@ -0,0 +1,83 @@
+import numpy as np
+
+import svg
+
+
+def test_obj_comments_and_indentation(tmp_path):
+    path = tmp_path / "mesh.obj"
+    path.write_text("# a square\n"
+                    "v 0 0 0 # origin\n"
+                    "  v 1 0 0\n"
+                    "\tv 1 1 0\n"
+                    "v 0 1 0#no space\n"
+                    "f 1 2 3 # tri\n"
+                    "   f 1 3 4\n"
+                    "f 1/1/1 2/2/2 3/3/3 4/4/4   # quad\n"
+                    "f -4 -3 -2\n")
+
+    mesh = svg.load_obj(str(path))
+
+    np.testing.assert_array_equal(mesh.faces, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    np.testing.assert_array_equal(mesh.face_offsets, [0, 3, 6, 10, 13])
+    np.testing.assert_array_equal(mesh.indices, [0, 1, 2, 0, 2, 3, 0, 1, 2, 3, 0, 1, 2])
+
+
+def _write_ply(path, vertices, polygons, endian, flags=None):
+    # Faces hold a uchar flag and a float weight around their index list
+    # when flags are given.
+    header = ["ply", "format binary_%s_endian 1.0" % ("little" if endian == "<" else "big"),
+              "element vertex %d" % len(vertices), "property float x", "property float y", "property float z",
+              "element face %d" % len(polygons)]
+    if flags is not None:
+        header.append("property uchar flag")
+    header.append("property list uchar int vertex_indices")
+    if flags is not None:
+        header.append("property float weight")
+    parts = ["\n".join(header + ["end_header"]).encode() + b"\n",
+             np.asarray(vertices, dtype=endian + "f4").tobytes()]
+    for i, polygon in enumerate(polygons):
+        if flags is not None:
+            parts.append(np.uint8(flags[i]).tobytes())
+        parts.append(np.uint8(len(polygon)).tobytes() + np.asarray(polygon, dtype=endian + "i4").tobytes())
+        if flags is not None:
+            parts.append(np.asarray(0.5 * i, dtype=endian + "f4").tobytes())
+    path.write_bytes(b"".join(parts))
+
+
+def test_ply_mixed_polygons(tmp_path):
+    rng = np.random.default_rng(0)
+    vertices = rng.uniform(-1, 1, (50, 3)).astype(np.float32)
+    polygons = [rng.integers(0, 50, count) for count in rng.integers(3, 6, 200)]
+    for endian in "<>":
+        for flags in (None, rng.integers(0, 256, len(polygons))):
+            path = tmp_path / "mesh.ply"
+            _write_ply(path, vertices, polygons, endian, flags)
+
+            mesh = svg.load_ply(str(path))
+
+            np.testing.assert_array_equal(mesh.faces, vertices)
+            np.testing.assert_array_equal(np.diff(mesh.face_offsets), [len(p) for p in polygons])
+            np.testing.assert_array_equal(mesh.indices, np.concatenate(polygons))
+
+
+def test_ply_element_columns_of_mixed_records():
+    # A flag, a list of uchar counted ints, a list of ushort counted
+    # ushorts and a double per record, big-endian, one byte off alignment.
+    records = [(7, [1, 2, 3], [], 0.25), (8, [4, 5, 6, 7], [9], -1.5), (9, [8, 9, 10], [1, 2], 3.0)]
+    data = [b"\0"]
+    for flag, first, second, value in records:
+        data += [bytes([flag, len(first)]), np.asarray(first, dtype=">i4").tobytes(),
+                 np.asarray(len(second), dtype=">u2").tobytes(), np.asarray(second, dtype=">u2").tobytes(),
+                 np.asarray(value, dtype=">f8").tobytes()]
+    data = np.frombuffer(b"".join(data) + b"rest", dtype=np.uint8)
+    properties = [("flag", "u1"), ("first", ("u1", "i4")), ("second", ("u2", "u2")), ("value", "f8")]
+
+    columns, size = svg._read_ply_element(data, 1, len(records), properties, ">")
+
+    assert size == len(data) - 1 - len(b"rest")
+    np.testing.assert_array_equal(columns["flag"], [7, 8, 9])
+    np.testing.assert_array_equal(columns["first"][0], [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+    np.testing.assert_array_equal(columns["first"][1], [3, 4, 3])
+    np.testing.assert_array_equal(columns["second"][0], [9, 1, 2])
+    np.testing.assert_array_equal(columns["second"][1], [0, 1, 2])
+    np.testing.assert_array_equal(columns["value"], [0.25, -1.5, 3.0])
@@ -0,0 +1,43 @@
+import io
+
+import numpy as np
+import pytest
+
+import svg
+
+# A concave quad in front of a triangle that shows through its notch.
+_TRIANGLE = [(-0.2, -0.7, 0.5), (0.2, -0.7, 0.5), (0, -0.3, 0.5)]
+_DART = [(-0.8, -0.8, 0.1), (0, 0.2, 0.1), (0.8, -0.8, 0.1), (0, 0.8, 0.1)]
+
+
+def _render(mesh, **options):
+    camera = svg.Camera(np.eye(4), np.eye(4))
+    output = io.StringIO()
+    svg.Engine([svg.View(camera, svg.Scene([mesh]))], **options).render_stream(output)
+    return output.getvalue()
+
+
+@pytest.mark.parametrize("roll", range(4))
+def test_concave_polygons_do_not_cover_their_notch(roll):
+    dart = _DART[roll:] + _DART[:roll]
+    mesh = svg.Mesh(np.array(_TRIANGLE + dart), np.array([0, 3, 7]))
+
+    assert _render(mesh).count("<polygon") == 2
+    assert _render(mesh, occlusion_resolution=128).count("<polygon") == 2
+
+
+def test_triangulation_covers_concave_polygons_exactly():
+    comb = [(0, 0), (5, 0), (5, 3), (4, 3), (4, 1), (3, 1), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)]
+    polygons = [np.array(comb, dtype=float), np.array(comb[::-1], dtype=float), np.array(_DART)[:, :2]]
+    xy = np.concatenate(polygons)
+    face_offsets = np.concatenate([[0], np.cumsum([len(polygon) for polygon in polygons])])
+
+    triangles, faces = svg.Engine._triangulate(xy, face_offsets)
+
+    corners = xy[triangles]
+    edges = corners[:, 1:] - corners[:, :1]
+    doubled = edges[:, 0, 0] * edges[:, 1, 1] - edges[:, 0, 1] * edges[:, 1, 0]
+    areas = svg.Engine._signed_areas(xy, face_offsets)
+    np.testing.assert_array_equal(np.bincount(faces), np.diff(face_offsets) - 2)
+    assert np.all(np.sign(doubled) == np.sign(areas[faces]))
+    np.testing.assert_allclose(np.bincount(faces, weights=doubled), areas)
@@ -0,0 +1,55 @@
+import numpy as np
+import pyrr
+import pytest
+
+import svg
+
+
+def _camera():
+    view = pyrr.matrix44.create_look_at(eye=[0, 0, -4], target=[0, 0, 0], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=40, aspect=1, near=1, far=8)
+    return svg.Camera(view, projection)
+
+
+def _random_mesh(rng, num_faces, indexed=False):
+    # Faces of one to six corners, spread well past the frustum on every side,
+    # some of them behind the camera.
+    counts = rng.integers(1, 7, num_faces)
+    face_offsets = np.concatenate([[0], np.cumsum(counts)])
+    if not indexed:
+        return svg.Mesh(rng.uniform(-6, 6, (face_offsets[-1], 3)), face_offsets)
+    vertices = rng.uniform(-6, 6, (num_faces, 3))
+    return svg.Mesh(vertices, face_offsets, indices=rng.integers(0, num_faces, face_offsets[-1]))
+
+
+def _accepted_faces_by_loop(camera, mesh):
+    # The per-face loop the vectorized rejection replaced.
+    projection = np.dot(camera.view, camera.projection)
+    corners = np.asarray(mesh.faces)
+    if mesh.indices is not None:
+        corners = corners[mesh.indices]
+    face_idxs = np.repeat(np.arange(mesh.num_faces), np.diff(mesh.face_offsets))
+    faces = np.dot(np.concatenate([corners, np.ones((len(corners), 1))], axis=-1), projection)
+    xyz, w = faces[..., :3], faces[..., 3:]
+    accepted = np.all(np.logical_and(np.greater(xyz, -w), np.less(xyz, +w)), axis=-1)
+    degenerate = np.less_equal(w, 0).squeeze(axis=-1)
+    for i in range(mesh.num_faces):
+        accepted[face_idxs == i] = np.any(accepted[face_idxs == i])
+        degenerate[face_idxs == i] = np.any(degenerate[face_idxs == i])
+    accepted = np.logical_and(accepted, np.logical_not(degenerate))
+    return np.unique(face_idxs[accepted])
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("indexed", [False, True])
+def test_rejection_matches_per_face_loop(seed, indexed):
+    rng = np.random.default_rng(seed)
+    camera = _camera()
+    mesh = _random_mesh(rng, 500, indexed)
+    engine = svg.Engine([])
+
+    face_ids = engine._project(np.dot(camera.view, camera.projection), mesh)[3]
+
+    expected = _accepted_faces_by_loop(camera, mesh)
+    assert 0 < len(expected) < mesh.num_faces
+    np.testing.assert_array_equal(np.sort(face_ids), expected)
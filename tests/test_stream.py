@@ -0,0 +1,45 @@
+import re
+
+import numpy as np
+import pyrr
+import pytest
+
+import svg
+
+
+def _views():
+    rng = np.random.default_rng(0)
+    view = pyrr.matrix44.create_look_at(eye=[0, 0, -4], target=[0, 0, 0], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=40, aspect=1, near=1, far=8)
+    camera = svg.Camera(view, projection)
+
+    def shader(face_index, winding):
+        return dict(fill="#%06x" % (face_index * 997 % 0xffffff), fill_opacity=0.5 if winding > 0 else 1.0)
+
+    counts = rng.integers(3, 6, 200)
+    polygons = svg.Mesh(rng.uniform(-1, 1, (counts.sum(), 3)), np.concatenate([[0], np.cumsum(counts)]),
+                        shader=shader, style=dict(stroke="black", stroke_width="0.001"))
+    indexed = svg.Mesh.from_indexed(rng.uniform(-1, 1, (60, 3)), rng.integers(0, 60, (150, 3)),
+                                    style=dict(fill="white", stroke_linejoin="round"))
+    lines = svg.Mesh(rng.uniform(-1, 1, (200, 3)), np.arange(0, 201, 2), style=dict(stroke="red"),
+                     shader=lambda face_index, winding: dict(stroke_width=face_index / 1000))
+    points = svg.Mesh.from_points(rng.uniform(-1, 1, (80, 3)), circle_radius=0.01,
+                                  shader=lambda face_index, winding: dict(fill="blue") if face_index % 2 else None)
+    return [svg.View(camera, svg.Scene([polygons, indexed, lines])),
+            svg.View(camera, svg.Scene([points]), svg.Viewport(-0.5, 0, 1, 0.5))]
+
+
+@pytest.mark.parametrize("profile", ["full", "tiny"])
+def test_stream_matches_render(profile, tmp_path):
+    # Tiny has no clip paths, so svgwrite must not validate the drawing.
+    options = dict(profile=profile, debug=profile != "tiny")
+    engine = svg.Engine(_views())
+    engine.render(str(tmp_path / "dom.svg"), **options)
+    engine.render_stream(str(tmp_path / "stream.svg"), **options)
+
+    # svgwrite numbers clip paths with a process-wide counter.
+    dom, stream = [re.sub(r"id\d+", "id", (tmp_path / name).read_text(encoding="utf-8"))
+                   for name in ("dom.svg", "stream.svg")]
+    for tag in ("<polygon", "<line", "<circle"):
+        assert tag in dom
+    assert stream == dom
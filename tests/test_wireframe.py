@@ -0,0 +1,26 @@
+import numpy as np
+import pyrr
+
+import svg
+
+
+def _edges(mesh):
+    view = pyrr.matrix44.create_look_at(eye=[0, 0, -4], target=[0, 0, 0], up=[0, 1, 0])
+    projection = pyrr.matrix44.create_perspective_projection(fovy=40, aspect=1, near=1, far=8)
+    edges = svg.Engine([])._edge_mesh(np.dot(view, projection), mesh)
+    corners = np.asarray(edges.faces)[edges.indices].reshape(-1, 2, 3)
+    return {tuple(sorted(map(tuple, edge.tolist()))) for edge in corners}
+
+
+def test_edges_skip_faces_without_corners():
+    first = [[0, 0, 0], [1, 0, 0], [0, 1, 0]]
+    second = [[2, 0, 0], [3, 0, 0], [2, 1, 0]]
+    # Label 1 is unused, so face 1 has no corners.
+    mesh = svg.Mesh.from_face_idxs(np.array(first + second, dtype=float), [0, 0, 0, 2, 2, 2], wireframe=True)
+    assert list(np.diff(mesh.face_offsets)) == [3, 0, 3]
+
+    expected = set()
+    for triangle in (first, second):
+        for i in range(3):
+            expected.add(tuple(sorted([tuple(map(float, triangle[i])), tuple(map(float, triangle[i - 1]))])))
+    assert _edges(mesh) == expected